@@ -1,66 +1,131 @@
 """sessions.db 구조와 내용 확인."""
-import json
+import io
 import sqlite3
+import sys
+
+try:
+    from orjson import loads
+except ImportError:
+    from json import loads
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# data 컬럼에서 출력하는 요약 필드와 형식
+_FIELD_FORMATS = {
+    "session_id": "  session_id:      {}\n",
+    "start_time": "  start_time:      {}\n",
+    "end_time": "  end_time:        {}\n",
+    "duration_seconds": "  duration_seconds:{}\n",
+    "total_chunks": "  total_chunks:    {}\n",
+    "avg_rms": "  avg_rms:         {:.6f}\n",
+    "status": "  status:          {}\n",
+}
+
+
+def iter_session_data(raw: str):
+    """data 컬럼을 문서 순서대로 (키, 값) 또는 ("chunk", 청크 dict)로 내보냅니다.
+
+    ijson이 있으면 JSON을 한 번만 훑으면서 청크를 하나씩 만들어 내보내므로,
+    청크 목록 전체를 메모리에 올리지 않습니다.
+    """
+    if ijson is None:
+        for key, value in loads(raw).items():
+            if key == "chunks":
+                for chunk in value:
+                    yield "chunk", chunk
+            elif key in _FIELD_FORMATS:
+                yield key, value
+        return
+
+    builder = None
+    for prefix, event, value in ijson.parse(io.BytesIO(raw.encode()), use_float=True):
+        if prefix == "chunks.item":
+            if event == "start_map":
+                builder = ijson.ObjectBuilder()
+            builder.event(event, value)
+            if event == "end_map":
+                yield "chunk", builder.value
+                builder = None
+        elif builder is not None:
+            builder.event(event, value)
+        elif prefix in _FIELD_FORMATS and event not in ("start_map", "start_array"):
+            yield prefix, value
 
 db_path = "test_recordings/sessions.db"
 
-conn = sqlite3.connect(db_path)
+# 읽기 전용으로 열어 녹음 중인 writer와 경합하지 않음
+conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True, isolation_level=None)
+conn.execute("PRAGMA query_only=1")
+conn.row_factory = sqlite3.Row
+# DB 파일을 메모리 매핑하여 read() 시스템 콜 대신 페이지 캐시로 읽음
+conn.execute("PRAGMA mmap_size=268435456")
+conn.execute("PRAGMA cache_size=-65536")
 
-print("=" * 60)
-print("  sessions.db 구조 분석")
-print("=" * 60)
-print()
+# 결과를 모아두지 않고 만들어지는 대로 바로 출력
+write = sys.stdout.write
+
+write("=" * 60 + "\n")
+write("  sessions.db 구조 분석\n")
+write("=" * 60 + "\n")
+write("\n")
 
 # 테이블 스키마
-print("📋 테이블 스키마:")
+write("📋 테이블 스키마:\n")
 cursor = conn.execute("PRAGMA table_info(sessions)")
-for col in cursor.fetchall():
-    print(f"  {col[1]:25} {col[2]:10} {'PK' if col[5] else ''}")
-
-print()
-print("-" * 60)
-
-# 저장된 세션들
-cursor = conn.execute("SELECT * FROM sessions")
-rows = cursor.fetchall()
-columns = [col[0] for col in cursor.description]
-
-print(f"\n📊 저장된 세션: {len(rows)}개\n")
-
-for row in rows:
-    print("=" * 60)
-    print(f"📁 Session ID: {row[0]}")
-    print("-" * 60)
-    print(f"  start_time:          {row[1]}")
-    print(f"  end_time:            {row[2]}")
-    print(f"  status:              {row[3]}")
-    print(f"  tags:                {row[4]}")
-    print(f"  transcription_status:{row[5]}")
-    print(f"  transcription_path:  {row[6]}")
-    print(f"  notes:               {row[7]}")
-    
-    # JSON data 파싱
-    print()
-    print("📦 전체 데이터 (data 컬럼):")
-    data = json.loads(row[8])
-    
-    print(f"  session_id:      {data['session_id']}")
-    print(f"  start_time:      {data['start_time']}")
-    print(f"  end_time:        {data['end_time']}")
-    print(f"  duration_seconds:{data['duration_seconds']}")
-    print(f"  total_chunks:    {data['total_chunks']}")
-    print(f"  avg_rms:         {data['avg_rms']:.6f}")
-    print(f"  status:          {data['status']}")
-    
-    print()
-    print("  🎵 청크 목록:")
-    for i, chunk in enumerate(data['chunks']):
-        status = "🔇" if chunk['is_silent'] else "🔊"
-        print(f"    [{i+1}] {status} {chunk['file_path']}")
-        print(f"        timestamp: {chunk['timestamp']}")
-        print(f"        duration:  {chunk['duration_seconds']:.1f}초")
-        print(f"        RMS:       {chunk['rms_level']:.6f}")
+for col in cursor:
+    write(f"  {col[1]:25} {col[2]:10} {'PK' if col[5] else ''}\n")
+
+write("\n")
+write("-" * 60 + "\n")
+
+# 저장된 세션들 (fetchall 없이 커서를 직접 순회)
+session_count = conn.execute("SELECT COUNT(*) FROM sessions").fetchone()[0]
+cursor = conn.execute(
+    "SELECT session_id, start_time, end_time, status, tags,"
+    " transcription_status, transcription_path, notes, data FROM sessions"
+)
+
+write(f"\n📊 저장된 세션: {session_count}개\n\n")
+
+for row in cursor:
+    write("=" * 60 + "\n")
+    write(f"📁 Session ID: {row['session_id']}\n")
+    write("-" * 60 + "\n")
+    write(f"  start_time:          {row['start_time']}\n")
+    write(f"  end_time:            {row['end_time']}\n")
+    write(f"  status:              {row['status']}\n")
+    write(f"  tags:                {row['tags']}\n")
+    write(f"  transcription_status:{row['transcription_status']}\n")
+    write(f"  transcription_path:  {row['transcription_path']}\n")
+    write(f"  notes:               {row['notes']}\n")
+
+    # JSON data 파싱 (필드와 청크를 JSON에 나온 순서대로 바로 출력)
+    write("\n")
+    write("📦 전체 데이터 (data 컬럼):\n")
+    n_chunks = 0
+    in_chunks = False
+    for key, value in iter_session_data(row['data']):
+        if key != "chunk":
+            if in_chunks:
+                write("\n")
+                in_chunks = False
+            write(_FIELD_FORMATS[key].format(value))
+            continue
+        if n_chunks == 0:
+            write("\n  🎵 청크 목록:\n")
+        in_chunks = True
+        n_chunks += 1
+        status = "🔇" if value['is_silent'] else "🔊"
+        write(
+            f"    [{n_chunks}] {status} {value['file_path']}\n"
+            f"        timestamp: {value['timestamp']}\n"
+            f"        duration:  {value['duration_seconds']:.1f}초\n"
+            f"        RMS:       {value['rms_level']:.6f}\n"
+        )
+    write("\n")
 
 conn.close()
-print()
-print("=" * 60)
+write("=" * 60 + "\n")
@@ -1,5 +1,7 @@
 """Ollama 연결 테스트."""
 
+import asyncio
+
 from voicelink.title_generator import TitleGenerator, TitleGeneratorConfig
 
 print("=" * 60)
@@ -41,9 +43,11 @@ if generator.is_available():
             "고객사와 통화했습니다. 다음 달 납품 일정을 조율했습니다.",
         ]
 
-        for i, transcript in enumerate(test_cases, 1):
+        # 순차 호출 대신 한 번에 동시 요청
+        titles = asyncio.run(generator.generate_many(test_cases))
+
+        for i, (transcript, title) in enumerate(zip(test_cases, titles), 1):
             print(f"  [{i}] 전사문: {transcript[:50]}...")
-            title = generator.generate(transcript)
             print(f"      → 제목: {title}")
             print()
 
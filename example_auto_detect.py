@@ -42,7 +42,8 @@ print("=" * 60)
 print("\n[방법 2] detect_and_set_device() 사용")
 print("-" * 50)
 vl2 = VoiceLink()
-device = vl2.detect_and_set_device()
+# 방법 1의 스캔 결과가 60초 이내라면 장치를 다시 열지 않고 재사용
+device = vl2.detect_and_set_device(cache_seconds=60)
 
 if device:
     print(f"\n선택된 장치: [{device.index}] {device.name}")
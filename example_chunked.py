@@ -4,6 +4,7 @@
 30초 동안 실행하여 청크 파일 생성과 세션 관리를 확인합니다.
 """
 
+import os
 import time
 from pathlib import Path
 
@@ -83,7 +84,7 @@ print("=" * 60)
 
 # 세션 매니저로 결과 확인
 manager = SessionManager(config.storage.data_path)
-sessions = manager.get_today_sessions()
+sessions, stats = manager.get_today_summary()
 
 print(f"\n오늘 생성된 세션: {len(sessions)}개")
 for session in sessions:
@@ -93,20 +94,33 @@ for session in sessions:
     print(f"    청크: {session.total_chunks}개")
     print(f"    상태: {session.status}")
 
-stats = manager.get_stats()
 print(f"\n저장소 통계:")
 print(f"  총 세션: {stats['total_sessions']}개")
 print(f"  디스크 사용량: {stats['disk_usage_mb']:.2f} MB")
 
 # 파일 목록 확인
+def iter_wavs(root):
+    """WAV 파일 DirEntry를 재귀적으로 순회 (Path 객체/추가 stat 없이)."""
+    with os.scandir(root) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                yield from iter_wavs(entry.path)
+            elif entry.name.endswith(".wav"):
+                yield entry
+
 data_dir = Path(config.storage.data_path)
 if data_dir.exists():
-    wav_files = list(data_dir.rglob("*.wav"))
-    print(f"\n저장된 WAV 파일: {len(wav_files)}개")
-    for f in wav_files[:5]:  # 처음 5개만 표시
-        print(f"  - {f.relative_to(data_dir)}")
-    if len(wav_files) > 5:
-        print(f"  ... 외 {len(wav_files) - 5}개")
+    wav_count = 0
+    shown = []
+    for entry in iter_wavs(data_dir):
+        wav_count += 1
+        if len(shown) < 5:  # 처음 5개만 표시
+            shown.append(os.path.relpath(entry.path, data_dir))
+    print(f"\n저장된 WAV 파일: {wav_count}개")
+    for rel in shown:
+        print(f"  - {rel}")
+    if wav_count > 5:
+        print(f"  ... 외 {wav_count - 5}개")
 
 print()
 print("테스트 완료!")
@@ -4,6 +4,7 @@
 Docker에서 Ollama가 실행 중이어야 합니다.
 """
 
+import threading
 import time
 from pathlib import Path
 
@@ -53,6 +54,8 @@ print()
 # LLM 연결 확인
 if title_gen.is_available():
     print(f"🤖 LLM 모델: {title_gen.config.model} ✅")
+    # 녹음하는 동안 모델을 미리 로드 (세션 완료 콜백의 콜드 스타트 방지)
+    threading.Thread(target=title_gen.warm_up, daemon=True).start()
 else:
     print("⚠️ LLM 서버 연결 실패 - 제목 생성 비활성화")
 print()
@@ -118,7 +121,7 @@ print("=" * 60)
 
 # 세션 매니저로 결과 확인
 manager = SessionManager(config.storage.data_path)
-sessions = manager.get_today_sessions()
+sessions, stats = manager.get_today_summary()
 
 print(f"\n오늘 생성된 세션: {len(sessions)}개")
 for session in sessions:
@@ -128,7 +131,6 @@ for session in sessions:
     print(f"    청크: {session.total_chunks}개")
     print(f"    상태: {session.status}")
 
-stats = manager.get_stats()
 print(f"\n저장소 통계:")
 print(f"  총 세션: {stats['total_sessions']}개")
 print(f"  디스크 사용량: {stats['disk_usage_mb']:.2f} MB")
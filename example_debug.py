@@ -1,13 +1,27 @@
 """VoiceLink 디버그 스크립트 - 오디오 캡처 문제 진단용"""
 
 import logging
+import queue
+import re
 import sys
+import threading
 import time
+import wave
 from pathlib import Path
 
 import numpy as np
 import sounddevice as sd
 
+try:
+    import soundfile as sf
+except ImportError:
+    sf = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 # 로깅 설정 - DEBUG 레벨로 상세 로그 출력
 logging.basicConfig(
     level=logging.DEBUG,
@@ -19,12 +33,60 @@ logging.basicConfig(
 )
 
 logger = logging.getLogger('voicelink_debug')
+# Numba JIT 컴파일 DEBUG 로그가 디버그 출력을 덮지 않도록 제한
+logging.getLogger('numba').setLevel(logging.WARNING)
+
+# 구분선 (매번 문자열을 새로 만들지 않도록 모듈 로드 시 한 번만 생성)
+_BAR = "=" * 60
+
+# 장치 이름 분류용 패턴 (모듈 로드 시 한 번만 컴파일)
+_VIRTUAL_RE = re.compile(r'virtual|cable|vb-audio|blackhole|loopback')
+_LOOPBACK_RE = re.compile(r'cable output')
+
+# sd.query_devices() 결과 캐시 (실행 중 PortAudio 장치 목록을 한 번만 조회)
+_all_devices = None
+
+def query_all_devices():
+    """전체 장치 목록을 한 번만 조회하여 재사용"""
+    global _all_devices
+    if _all_devices is None:
+        _all_devices = sd.query_devices()
+    return _all_devices
+
+def _accumulate_block_numpy(indata, buf, write_idx):
+    """블록을 버퍼에 복사하고 (제곱합, peak)를 반환 (NumPy 버전)"""
+    n = min(indata.shape[0], buf.shape[0] - write_idx)
+    buf[write_idx:write_idx + n] = indata[:n]
+    sum_sq = float(np.einsum('ij,ij->', indata, indata))
+    peak = float(max(-indata.min(), indata.max())) if indata.size else 0.0
+    return sum_sq, peak
+
+
+if njit is not None:
+    @njit(cache=True, fastmath=True, boundscheck=False)
+    def _accumulate_block(indata, buf, write_idx):
+        """복사 + 제곱합 + peak를 한 번의 루프로 처리 (Numba 버전)"""
+        sum_sq = 0.0
+        peak = 0.0
+        n = min(indata.shape[0], buf.shape[0] - write_idx)
+        for i in range(indata.shape[0]):
+            for j in range(indata.shape[1]):
+                v = indata[i, j]
+                if i < n:
+                    buf[write_idx + i, j] = v
+                a = abs(v)
+                if a > peak:
+                    peak = a
+                sum_sq += v * v
+        return sum_sq, peak
+else:
+    _accumulate_block = _accumulate_block_numpy
 
 def debug_separator(title: str):
     """디버그 섹션 구분선 출력"""
-    logger.info("=" * 60)
-    logger.info(f"  {title}")
-    logger.info("=" * 60)
+    logger.info(_BAR)
+    logger.info("  %s", title)
+    logger.info(_BAR)
 
 def check_system_audio():
     """시스템 오디오 상태 확인"""
@@ -41,7 +103,7 @@ def check_system_audio():
     
     if default_input is not None:
         try:
-            default_input_info = sd.query_devices(default_input)
+            default_input_info = query_all_devices()[default_input]
             logger.info(f"기본 입력 장치: {default_input_info['name']}")
         except Exception as e:
             logger.error(f"기본 입력 장치 조회 실패: {e}")
@@ -52,7 +114,7 @@ def list_all_devices():
     """모든 오디오 장치 나열"""
     debug_separator("2. 모든 오디오 장치 나열")
     
-    devices = sd.query_devices()
+    devices = query_all_devices()
     logger.info(f"총 장치 수: {len(devices)}")
     
     # 입력 가능한 장치만 필터링
@@ -61,17 +123,18 @@ def list_all_devices():
     loopback_devices = []
     
     for idx, device in enumerate(devices):
-        if device['max_input_channels'] > 0:
-            input_devices.append((idx, device))
-            name_lower = device['name'].lower()
+        if device['max_input_channels'] <= 0:
+            continue
+        input_devices.append((idx, device))
+        name_lower = device['name'].lower()
+        
+        # Virtual 장치 확인
+        if _VIRTUAL_RE.search(name_lower):
+            virtual_devices.append((idx, device))
             
-            # Virtual 장치 확인
-            if any(v in name_lower for v in ['virtual', 'cable', 'vb-audio', 'blackhole', 'loopback']):
-                virtual_devices.append((idx, device))
-                
-            # Loopback 확인 (Windows CABLE Output)
-            if 'cable output' in name_lower:
-                loopback_devices.append((idx, device))
+        # Loopback 확인 (Windows CABLE Output)
+        if _LOOPBACK_RE.search(name_lower):
+            loopback_devices.append((idx, device))
     
     logger.info(f"\n입력 가능 장치 ({len(input_devices)}개):")
     for idx, dev in input_devices:
@@ -139,37 +202,49 @@ def test_audio_capture(device_index: int, duration: float = 3.0):
     
     sample_rate = 44100
     channels = 2
-    audio_data = []
+    buf: np.ndarray = np.empty((0, channels), dtype=np.float32)
+    write_idx = 0
+    sum_sq = 0.0
+    n_values = 0
     callback_count = 0
     total_samples = 0
     
     def audio_callback(indata, frames, time_info, status):
-        nonlocal callback_count, total_samples
+        nonlocal callback_count, total_samples, write_idx, sum_sq, n_values
         callback_count += 1
         total_samples += frames
         
-        # 오디오 레벨 계산
-        rms = np.sqrt(np.mean(indata**2))
-        peak = np.max(np.abs(indata))
-        
-        # 처음 5번과 이후 50번마다 로그
-        if callback_count <= 5 or callback_count % 50 == 0:
-            logger.debug(f"Callback #{callback_count}: frames={frames}, RMS={rms:.6f}, Peak={peak:.6f}, status={status}")
+        # 버퍼 복사 + 오디오 레벨 계산 (제곱합을 누적해 전체 RMS를 다시 계산하지 않음)
+        block_sq, peak = _accumulate_block(indata, buf, write_idx)
+        write_idx += min(frames, len(buf) - write_idx)
+        sum_sq += block_sq
+        n_values += indata.size
         
-        audio_data.append(indata.copy())
+        # 처음 5번과 이후 50번마다 로그 (로그를 남길 때만 블록 RMS 계산)
+        if (callback_count <= 5 or callback_count % 50 == 0) and logger.isEnabledFor(logging.DEBUG):
+            rms = np.sqrt(block_sq / indata.size) if indata.size else 0.0
+            logger.debug("Callback #%d: frames=%d, RMS=%.6f, Peak=%.6f, status=%s",
+                         callback_count, frames, rms, peak, status)
     
     try:
-        device_info = sd.query_devices(device_index)
+        device_info = query_all_devices()[device_index]
         logger.info(f"테스트 장치: {device_info['name']}")
         logger.info(f"  max_input_channels: {device_info['max_input_channels']}")
         logger.info(f"  default_samplerate: {device_info['default_samplerate']}")
         
+        channels = min(channels, device_info['max_input_channels'])
+        buf = np.empty((int(sample_rate * duration * 1.1), channels), dtype=np.float32)
+        
+        # 오디오 콜백 안에서 JIT 컴파일이 일어나 input overflow가 나지 않도록
+        # 스트림을 열기 직전에 한 번 호출해 컴파일 (import 시점에는 하지 않음)
+        _accumulate_block(np.zeros((1, channels), dtype=np.float32), buf, 0)
+        
         logger.info(f"\n캡처 시작... ({duration}초)")
         
         with sd.InputStream(
             device=device_index,
             samplerate=sample_rate,
-            channels=min(channels, device_info['max_input_channels']),
+            channels=channels,
             dtype='float32',
             callback=audio_callback
         ):
@@ -180,9 +255,9 @@ def test_audio_capture(device_index: int, duration: float = 3.0):
         logger.info(f"  총 샘플 수: {total_samples}")
         logger.info(f"  예상 샘플 수: {int(sample_rate * duration)}")
         
-        if audio_data:
-            combined = np.concatenate(audio_data, axis=0)
-            overall_rms = np.sqrt(np.mean(combined**2))
+        if write_idx:
+            combined = buf[:write_idx]
+            overall_rms = np.sqrt(sum_sq / n_values)
             overall_peak = np.max(np.abs(combined))
             
             logger.info(f"\n[오디오 분석 결과]")
@@ -211,6 +286,27 @@ def test_audio_capture(device_index: int, duration: float = 3.0):
         logger.error(traceback.format_exc())
         return None, 0, 0
 
+def _wav_writer_loop(blocks: queue.SimpleQueue, path: Path, sample_rate: int, channels: int):
+    """큐로 받은 float32 블록을 16비트 WAV로 기록 (None을 받으면 종료)
+
+    오디오 콜백 스레드에서 디스크 I/O와 변환을 하지 않도록 별도 스레드에서 실행.
+    soundfile이 있으면 SoundFile로 스트리밍 기록하고, 없으면 wave 모듈을 사용.
+    """
+    if sf is not None:
+        with sf.SoundFile(str(path), "w", samplerate=sample_rate, channels=channels,
+                          subtype="PCM_16") as f:
+            while (block := blocks.get()) is not None:
+                # 범위를 넘는 샘플이 int16 변환에서 뒤집히지 않도록 클리핑
+                f.write(np.clip(block, -1.0, 1.0))
+    else:
+        with wave.open(str(path), "wb") as wf:
+            wf.setnchannels(channels)
+            wf.setsampwidth(2)  # 16-bit
+            wf.setframerate(sample_rate)
+            while (block := blocks.get()) is not None:
+                pcm = np.clip(block, -1.0, 1.0) * 32767
+                wf.writeframes(pcm.astype(np.int16).tobytes())
+
 def test_voicelink_recording(duration: float = 5.0):
     """VoiceLink 녹음 기능 테스트"""
     debug_separator(f"5. VoiceLink 녹음 테스트 ({duration}초)")
@@ -239,34 +335,56 @@ def test_voicelink_recording(duration: float = 5.0):
     else:
         logger.warning("장치 해결 실패 - 기본 입력 장치 사용 예정")
     
-    audio_chunks = []
+    # 청크 리스트 + concatenate 대신 미리 할당한 버퍼에 직접 기록
+    max_samples = int(config.sample_rate * duration * 1.2)
+    buf = np.empty((max_samples, config.channels), dtype=np.float32)
+    write_idx = 0
     chunk_count = 0
     
     def debug_callback(data):
-        nonlocal chunk_count
+        nonlocal chunk_count, write_idx
         chunk_count += 1
-        rms = np.sqrt(np.mean(data**2))
-        if chunk_count <= 3 or chunk_count % 20 == 0:
-            logger.debug(f"Chunk #{chunk_count}: shape={data.shape}, RMS={rms:.6f}")
-        audio_chunks.append(data)
+        if (chunk_count <= 3 or chunk_count % 20 == 0) and logger.isEnabledFor(logging.DEBUG):
+            flat = data.ravel()
+            rms = np.sqrt(float(flat @ flat) / flat.size) if flat.size else 0.0
+            logger.debug("Chunk #%d: shape=%s, RMS=%.6f", chunk_count, data.shape, rms)
+        n = min(data.shape[0], max_samples - write_idx)
+        buf[write_idx:write_idx + n] = data[:n]
+        write_idx += n
+        # 파일 기록은 writer 스레드에 넘김 (data는 콜백마다 새로 받는 배열)
+        wav_blocks.put(data)
     
     capture.add_callback(debug_callback)
     
-    logger.info("캡처 시작...")
-    success = capture.start()
-    
-    if not success:
-        logger.error(f"❌ 캡처 시작 실패: {capture.state.error}")
-        return
-    
-    logger.info(f"캡처 중... (is_capturing={capture.is_capturing})")
-    time.sleep(duration)
+    # 청크가 도착할 때마다 WAV에 스트리밍 기록 (마지막에 전체 int16 사본을 만들지 않음)
+    wav_blocks: queue.SimpleQueue = queue.SimpleQueue()
+    writer = threading.Thread(
+        target=_wav_writer_loop,
+        args=(wav_blocks, output_path, config.sample_rate, config.channels),
+        daemon=True,
+    )
+    writer.start()
     
-    capture.stop()
+    try:
+        logger.info("캡처 시작...")
+        success = capture.start()
+        
+        if not success:
+            logger.error(f"❌ 캡처 시작 실패: {capture.state.error}")
+            return
+        
+        logger.info(f"캡처 중... (is_capturing={capture.is_capturing})")
+        time.sleep(duration)
+        
+        capture.stop()
+    finally:
+        # 예외가 나도 writer가 파일을 닫고 끝나도록 종료 신호를 보냄
+        wav_blocks.put(None)
+        writer.join()
     logger.info(f"캡처 종료 - 총 {chunk_count}개 청크 수집")
     
-    if audio_chunks:
-        combined = np.concatenate(audio_chunks, axis=0)
+    if write_idx:
+        combined = buf[:write_idx]
         rms = np.sqrt(np.mean(combined**2))
         peak = np.max(np.abs(combined))
         
@@ -275,10 +393,7 @@ def test_voicelink_recording(duration: float = 5.0):
         logger.info(f"  RMS: {rms:.6f}")
         logger.info(f"  Peak: {peak:.6f}")
         
-        # WAV 파일로 저장
-        from scipy.io import wavfile
-        audio_int16 = (combined * 32767).astype(np.int16)
-        wavfile.write(str(output_path), 44100, audio_int16)
+        # WAV 파일은 캡처 중 이미 기록됨
         logger.info(f"  저장됨: {output_path.absolute()}")
         
         # 파일 크기 확인
@@ -292,9 +407,7 @@ def test_voicelink_recording(duration: float = 5.0):
 
 def main():
     """메인 디버그 실행"""
-    print("\n" + "=" * 60)
-    print("  VoiceLink 디버그 모드")
-    print("=" * 60 + "\n")
+    print(f"\n{_BAR}\n  VoiceLink 디버그 모드\n{_BAR}\n")
     
     # 1. 시스템 상태 확인
     default_input, default_output = check_system_audio()
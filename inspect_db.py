@@ -1,6 +1,7 @@
 import json
 import os
 import sqlite3
+import sys
 from pathlib import Path
 
 # DB 경로
@@ -13,7 +14,18 @@ if not db_path.exists():
     exit(1)
 
 try:
-    with sqlite3.connect(db_path) as conn:
+    # 읽기 전용으로 열어 녹음 중인 writer와 경합하지 않음
+    with sqlite3.connect(f"{db_path.absolute().as_uri()}?mode=ro", uri=True) as conn:
+        conn.execute("PRAGMA query_only=1")
+        # 읽기용 PRAGMA를 한 번에 설정
+        conn.executescript(
+            "PRAGMA temp_store=MEMORY;"
+            " PRAGMA mmap_size=268435456;"
+            " PRAGMA cache_size=-65536;"
+        )
+        # 스키마/데이터 조회를 하나의 읽기 트랜잭션으로 묶음
+        # (쓰기 스크립트라면 executemany로 여러 행을 한 트랜잭션에서 INSERT 하는 것이 훨씬 빠름)
+        conn.execute("BEGIN")
         print("\n📊 1. 테이블 스키마 확인 (`sessions` 테이블)")
         try:
             cursor = conn.execute("PRAGMA table_info(sessions)")
@@ -41,13 +53,15 @@ try:
             if not rows:
                 print("   (데이터 없음)")
             else:
+                out: list[str] = []
                 for row in rows:
-                    print(f"   - ID: {row[0]}")
-                    print(f"     시간: {row[1]}")
-                    print(f"     상태: {row[2]}")
+                    out.append(f"   - ID: {row[0]}\n")
+                    out.append(f"     시간: {row[1]}\n")
+                    out.append(f"     상태: {row[2]}\n")
                     if len(row) > 3:
-                        print(f"     제목: {row[3]}")
-                    print("     ---")
+                        out.append(f"     제목: {row[3]}\n")
+                    out.append("     ---\n")
+                sys.stdout.write("".join(out))
         except Exception as e:
             print(f"   데이터 조회 실패: {e}")
 
@@ -3,8 +3,11 @@
 import logging
 import threading
 import time
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
+import sounddevice as sd
+
+import voicelink.auto_detect as auto_detect
 from voicelink.chunked_recorder import ChunkedRecorder
 from voicelink.config import VoiceLinkConfig
 from voicelink.logging_config import setup_logging
@@ -55,16 +58,24 @@ def test_auto_switch():
     mock_device.has_signal = True
     
     # switch_device 내부의 sd.InputStream도 모의해야 에러가 안 남
-    with patch("voicelink.auto_detect.find_active_audio_device", return_value=mock_device), \
-         patch("sounddevice.InputStream"), \
-         patch("sounddevice.query_devices", return_value={'name': "Mock Active Device"}):
-        
+    # (mock.patch 대신 직접 교체하고 finally에서 복원)
+    orig_find = auto_detect.find_active_audio_device
+    orig_input_stream = sd.InputStream
+    orig_query_devices = sd.query_devices
+    auto_detect.find_active_audio_device = lambda *_a, **_k: mock_device
+    sd.InputStream = MagicMock()
+    sd.query_devices = lambda *_a, **_k: {'name': "Mock Active Device"}
+    try:
         # 강제로 스캔 트리거 (시간 체크 우회)
         recorder._last_device_scan_time = 0 
         recorder._check_alternative_devices()
         
         # 스레드 실행 대기
         time.sleep(1.0)
+    finally:
+        auto_detect.find_active_audio_device = orig_find
+        sd.InputStream = orig_input_stream
+        sd.query_devices = orig_query_devices
         
     # 4. 장치 변경 확인
     if switch_event.is_set():
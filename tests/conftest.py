@@ -0,0 +1,51 @@
+# pyright: ignore
+
+from __future__ import annotations
+
+import sys
+import types
+from typing import Any
+
+
+def _install_sounddevice_stub() -> None:
+    """Provide a minimal `sounddevice` module for test environments.
+
+    The production package depends on `sounddevice`, but some CI/dev
+    environments running these tests may not have the native dependency
+    available. Our CLI/E2E-style tests mock higher-level seams, so a tiny
+    stub is sufficient to allow imports.
+    """
+
+    sd = types.ModuleType("sounddevice")
+
+    def query_devices():
+        return []
+
+    class InputStream:
+        def __init__(self, *args: Any, **kwargs: Any):
+            self._callback = kwargs.get("callback")
+
+        def start(self) -> None:
+            return None
+
+        def stop(self) -> None:
+            return None
+
+        def close(self) -> None:
+            return None
+
+    class Stream(InputStream):
+        pass
+
+    sd.default = types.SimpleNamespace(device=(None, None))
+    sd.query_devices = query_devices
+    sd.InputStream = InputStream
+    sd.Stream = Stream
+    # Only referenced in callback annotations; never instantiated by tests.
+    sd.CallbackFlags = str
+
+    # Always stub for test determinism, even if `sounddevice` is installed.
+    sys.modules["sounddevice"] = sd
+
+
+_install_sounddevice_stub()
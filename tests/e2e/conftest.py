@@ -2,89 +2,135 @@
 
 from __future__ import annotations
 
-import sys
+import importlib
+import time
 import types
 from dataclasses import dataclass
-from pathlib import Path
 from typing import Any, Callable
+from unittest.mock import MagicMock
 
 import pytest
 from click.testing import CliRunner
 
+# Imported once at collection time; tests/conftest.py has already stubbed sounddevice.
+from voicelink.cli import main
+from voicelink.devices import AudioDevice
 
-def _install_sounddevice_stub() -> None:
-    """Provide a minimal `sounddevice` module for test environments.
 
-    The production package depends on `sounddevice`, but some CI/dev
-    environments running these tests may not have the native dependency
-    available. Our CLI/E2E-style tests mock higher-level seams, so a tiny
-    stub is sufficient to allow imports.
-    """
+@pytest.fixture(scope="session", autouse=True)
+def _preimport_stream() -> None:
+    """Load voicelink.stream up front; the CLI only imports it inside `stream`."""
+    importlib.import_module("voicelink.stream")
 
-    sd = types.ModuleType("sounddevice")
 
-    class _Default:
-        device = (None, None)
+@pytest.fixture(scope="session")
+def runner() -> CliRunner:
+    return CliRunner()
 
-    def query_devices():
-        return []
 
-    class CallbackFlags:
-        def __str__(self) -> str:  # pragma: no cover
-            return ""
+@pytest.fixture(scope="session")
+def invoke_cli(runner: CliRunner) -> Callable[[list[str], dict[str, Any] | None], Any]:
+    def _invoke(args: list[str], env: dict[str, Any] | None = None):
+        return runner.invoke(main, args, env=env, color=False)
 
-    class InputStream:
-        def __init__(self, *args: Any, **kwargs: Any):
-            self._callback = kwargs.get("callback")
+    return _invoke
 
-        def start(self) -> None:
-            return None
 
-        def stop(self) -> None:
-            return None
+@pytest.fixture(scope="session")
+def builtin_mic_device() -> AudioDevice:
+    return AudioDevice(
+        index=0,
+        name="Built-in Microphone",
+        max_input_channels=1,
+        max_output_channels=0,
+        default_samplerate=44100.0,
+        is_input=True,
+        is_output=False,
+        is_loopback=False,
+        is_virtual=False,
+    )
+
+
+@pytest.fixture(scope="session")
+def blackhole_device() -> AudioDevice:
+    return AudioDevice(
+        index=7,
+        name="BlackHole 2ch",
+        max_input_channels=2,
+        max_output_channels=2,
+        default_samplerate=48000.0,
+        is_input=True,
+        is_output=True,
+        is_loopback=True,
+        is_virtual=True,
+    )
+
+
+@pytest.fixture(scope="session")
+def cli_mod() -> types.ModuleType:
+    return importlib.import_module("voicelink.cli")
+
+
+# CLI seams that tests stub out.
+_CLI_SEAMS = (
+    "get_system_info",
+    "get_driver_status",
+    "check_virtual_mic_ready",
+    "find_best_loopback_device",
+    "record_audio",
+    "list_devices",
+    "print_devices",
+    "setup_driver",
+)
 
-        def close(self) -> None:
-            return None
 
-    class Stream(InputStream):
-        pass
+@dataclass(frozen=True)
+class CliSeams:
+    get_system_info: MagicMock
+    get_driver_status: MagicMock
+    check_virtual_mic_ready: MagicMock
+    find_best_loopback_device: MagicMock
+    record_audio: MagicMock
+    list_devices: MagicMock
+    print_devices: MagicMock
+    setup_driver: MagicMock
 
-    setattr(sd, "default", _Default())
-    setattr(sd, "query_devices", query_devices)
-    setattr(sd, "InputStream", InputStream)
-    setattr(sd, "Stream", Stream)
-    setattr(sd, "CallbackFlags", CallbackFlags)
 
-    # Always stub for test determinism, even if `sounddevice` is installed.
-    sys.modules["sounddevice"] = sd
+@pytest.fixture()
+def cli_seams(monkeypatch, cli_mod: types.ModuleType) -> CliSeams:
+    """Replace the CLI seams with fresh mocks for the requesting test only."""
+    mocks = {name: MagicMock(name=name) for name in _CLI_SEAMS}
+    for name, mock in mocks.items():
+        monkeypatch.setattr(cli_mod, name, mock)
+    return CliSeams(**mocks)
 
 
-_install_sounddevice_stub()
+@pytest.fixture(scope="session")
+def darwin_system_info() -> dict[str, str]:
+    return {
+        "platform": "darwin",
+        "system": "Darwin",
+        "release": "24.0.0",
+        "machine": "arm64",
+        "python_version": "3.12.0 (main, ...)\n",
+    }
 
 
 @pytest.fixture()
-def runner() -> CliRunner:
-    return CliRunner()
+def patch_system_info(cli_seams: CliSeams, darwin_system_info: dict[str, str]) -> dict[str, str]:
+    cli_seams.get_system_info.return_value = darwin_system_info
+    return darwin_system_info
 
 
 @pytest.fixture()
-def invoke_cli(runner: CliRunner) -> Callable[[list[str], dict[str, Any] | None], Any]:
-    from voicelink.cli import main
-
-    def _invoke(args: list[str], env: dict[str, Any] | None = None):
-        return runner.invoke(main, args, env=env, color=False)
-
-    return _invoke
-
-
-@dataclass(frozen=True)
-class CallCapture:
-    calls: list[tuple[tuple[Any, ...], dict[str, Any]]]
-
-    def record(self, *args: Any, **kwargs: Any) -> None:
-        self.calls.append((args, kwargs))
+def no_sleep(monkeypatch) -> list[float]:
+    """Replace time.sleep with a no-op and return the requested durations."""
+    calls: list[float] = []
+    monkeypatch.setattr(time, "sleep", calls.append)
+    return calls
 
 
 @pytest.fixture()
-def call_capture() -> CallCapture:
-    return CallCapture(calls=[])
+def call_capture() -> list[tuple[tuple[Any, ...], dict[str, Any]]]:
+    """Collects ``(args, kwargs)`` for each call made by a fake."""
+    return []
@@ -4,74 +4,61 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from voicelink.devices import AudioDevice
-
 
 def test_record_uses_best_loopback_device_when_not_provided(
-    invoke_cli, monkeypatch, call_capture, tmp_path
+    invoke_cli, cli_seams, call_capture, tmp_path, blackhole_device
 ):
-    loopback = AudioDevice(
-        index=7,
-        name="BlackHole 2ch",
-        max_input_channels=2,
-        max_output_channels=2,
-        default_samplerate=48000.0,
-        is_input=True,
-        is_output=True,
-        is_loopback=True,
-        is_virtual=True,
-    )
-    monkeypatch.setattr("voicelink.cli.find_best_loopback_device", lambda: loopback)
+    cli_seams.find_best_loopback_device.return_value = blackhole_device
 
     def fake_record_audio(**kwargs):
-        call_capture.record(**kwargs)
+        call_capture.append(((), kwargs))
         return Path(kwargs["output_path"])
 
-    monkeypatch.setattr("voicelink.cli.record_audio", fake_record_audio)
+    cli_seams.record_audio.side_effect = fake_record_audio
 
     out = tmp_path / "meeting.wav"
     result = invoke_cli(["record", "-o", str(out), "-d", "1"])
     assert result.exit_code == 0
     assert "Using loopback device: BlackHole 2ch" in result.output
     assert "Recording saved" in result.output
-    assert call_capture.calls[0][1]["device"] == 7
+    assert call_capture[0][1]["device"] == 7
 
 
-def test_record_warns_when_no_loopback_device(invoke_cli, monkeypatch, call_capture, tmp_path):
-    monkeypatch.setattr("voicelink.cli.find_best_loopback_device", lambda: None)
+def test_record_warns_when_no_loopback_device(invoke_cli, cli_seams, call_capture, tmp_path):
+    cli_seams.find_best_loopback_device.return_value = None
 
     def fake_record_audio(**kwargs):
-        call_capture.record(**kwargs)
+        call_capture.append(((), kwargs))
         return Path(kwargs["output_path"])
 
-    monkeypatch.setattr("voicelink.cli.record_audio", fake_record_audio)
+    cli_seams.record_audio.side_effect = fake_record_audio
 
     out = tmp_path / "meeting.wav"
     result = invoke_cli(["record", "-o", str(out), "-d", "1"])
     assert result.exit_code == 0
     assert "Warning: No loopback device found" in result.output
-    assert call_capture.calls[0][1]["device"] is None
+    assert call_capture[0][1]["device"] is None
 
 
-def test_record_passes_through_explicit_device(invoke_cli, monkeypatch, call_capture, tmp_path):
+def test_record_passes_through_explicit_device(invoke_cli, cli_seams, call_capture, tmp_path):
     def fake_record_audio(**kwargs):
-        call_capture.record(**kwargs)
+        call_capture.append(((), kwargs))
         return Path(kwargs["output_path"])
 
-    monkeypatch.setattr("voicelink.cli.record_audio", fake_record_audio)
+    cli_seams.record_audio.side_effect = fake_record_audio
 
     out = tmp_path / "meeting.wav"
     result = invoke_cli(["record", "-o", str(out), "-d", "1", "-D", "3", "-r", "48000", "-c", "1"])
     assert result.exit_code == 0
-    kwargs = call_capture.calls[0][1]
+    kwargs = call_capture[0][1]
     assert kwargs["device"] == 3
     assert kwargs["sample_rate"] == 48000
     assert kwargs["channels"] == 1
 
 
-def test_record_nonzero_exit_on_failure(invoke_cli, monkeypatch, tmp_path):
-    monkeypatch.setattr("voicelink.cli.find_best_loopback_device", lambda: None)
-    monkeypatch.setattr("voicelink.cli.record_audio", lambda **kwargs: None)
+def test_record_nonzero_exit_on_failure(invoke_cli, cli_seams, tmp_path):
+    cli_seams.find_best_loopback_device.return_value = None
+    cli_seams.record_audio.return_value = None
 
     out = tmp_path / "meeting.wav"
     result = invoke_cli(["record", "-o", str(out), "-d", "1"])
@@ -2,84 +2,64 @@
 
 from __future__ import annotations
 
-import time
+import re
+from types import SimpleNamespace
+from typing import ClassVar
 
-from dataclasses import dataclass
+_STREAM_RE = re.compile(r"Streaming to OpenAI.*Duration: 0\.1s.*\[Assistant\]: hello", re.S)
 
-from voicelink.devices import AudioDevice
 
+class FakeStream:
+    instances: ClassVar[list["FakeStream"]] = []
 
-def test_stream_requires_api_key(invoke_cli):
-    result = invoke_cli(["stream", "--duration", "0.1"])
-    assert result.exit_code == 1
-    assert "Error: OpenAI API key required" in result.output
-
-
-def test_stream_runs_and_stops_with_duration(invoke_cli, monkeypatch):
-    loopback = AudioDevice(
-        index=7,
-        name="BlackHole 2ch",
-        max_input_channels=2,
-        max_output_channels=2,
-        default_samplerate=48000.0,
-        is_input=True,
-        is_output=True,
-        is_loopback=True,
-        is_virtual=True,
-    )
-    monkeypatch.setattr("voicelink.cli.find_best_loopback_device", lambda: loopback)
+    def __init__(self, config):
+        self._state = SimpleNamespace(error=None)
+        self._started = False
+        self.stopped = False
+        self._callbacks = []
+        FakeStream.instances.append(self)
 
-    sleep_calls: list[float] = []
+    @property
+    def state(self):
+        return self._state
 
-    def fake_sleep(duration: float):
-        sleep_calls.append(duration)
+    @property
+    def is_streaming(self) -> bool:
+        return self._started
 
-    monkeypatch.setattr(time, "sleep", fake_sleep)
+    def add_response_callback(self, callback):
+        self._callbacks.append(callback)
 
-    @dataclass
-    class FakeState:
-        error: str | None = None
+    def start(self):
+        self._started = True
+        # Simulate a response event
+        for cb in self._callbacks:
+            cb({"type": "response.audio_transcript.done", "transcript": "hello"})
+        return True
 
-    stream_holder: dict[str, object] = {}
+    def stop(self):
+        self._started = False
+        self.stopped = True
 
-    class FakeStream:
-        def __init__(self, config):
-            self._state = FakeState(error=None)
-            self._started = False
-            self.stopped = False
-            self._callbacks = []
-            stream_holder["obj"] = self
 
-        @property
-        def state(self):
-            return self._state
-
-        @property
-        def is_streaming(self) -> bool:
-            return self._started
-
-        def add_response_callback(self, callback):
-            self._callbacks.append(callback)
+def test_stream_requires_api_key(invoke_cli):
+    result = invoke_cli(["stream", "--duration", "0.1"])
+    assert result.exit_code == 1
+    assert "Error: OpenAI API key required" in result.output
 
-        def start(self):
-            self._started = True
-            # Simulate a response event
-            for cb in self._callbacks:
-                cb({"type": "response.audio_transcript.done", "transcript": "hello"})
-            return True
 
-        def stop(self):
-            self._started = False
-            self.stopped = True
+def test_stream_runs_and_stops_with_duration(
+    invoke_cli, monkeypatch, cli_seams, blackhole_device, no_sleep
+):
+    cli_seams.find_best_loopback_device.return_value = blackhole_device
 
     import voicelink.stream as stream_mod
 
     monkeypatch.setattr(stream_mod, "OpenAIRealtimeStream", FakeStream)
+    monkeypatch.setattr(FakeStream, "instances", [])
 
     result = invoke_cli(["stream", "--api-key", "sk-test", "--duration", "0.1"])
     assert result.exit_code == 0
-    assert "Streaming to OpenAI" in result.output
-    assert "Duration: 0.1s" in result.output
-    assert "[Assistant]: hello" in result.output
-    assert sleep_calls == [0.1]
-    assert getattr(stream_holder["obj"], "stopped") is True
+    assert _STREAM_RE.search(result.output)
+    assert no_sleep == [0.1]
+    assert FakeStream.instances[-1].stopped is True
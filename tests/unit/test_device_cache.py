@@ -0,0 +1,130 @@
+# pyright: reportMissingImports=false
+
+from __future__ import annotations
+
+import types
+
+import pytest
+
+from voicelink import devices
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+def _raw(name: str, inputs: int = 2, outputs: int = 0) -> dict:
+    return {
+        "name": name,
+        "max_input_channels": inputs,
+        "max_output_channels": outputs,
+        "default_samplerate": 48000.0,
+    }
+
+
+@pytest.fixture
+def portaudio(monkeypatch):
+    """Count sd.query_devices() calls and control the cache clock."""
+    clock = _FakeClock()
+    state = types.SimpleNamespace(
+        calls=0,
+        clock=clock,
+        devices=[_raw("Built-in Microphone"), _raw("Virtual Cable 1")],
+    )
+
+    def query_devices():
+        state.calls += 1
+        return list(state.devices)
+
+    monkeypatch.setattr(devices.sd, "query_devices", query_devices)
+    monkeypatch.setattr(devices, "time", types.SimpleNamespace(monotonic=clock.monotonic))
+    devices.invalidate_device_cache()
+    yield state
+    devices.invalidate_device_cache()
+
+
+def test_list_devices_reuses_enumeration_within_ttl(portaudio):
+    first = devices.list_devices()
+    portaudio.clock.now += devices.DEVICE_CACHE_TTL / 2
+    second = devices.list_devices()
+
+    assert portaudio.calls == 1
+    assert [d.name for d in second] == [d.name for d in first]
+
+
+def test_list_devices_requeries_after_ttl(portaudio):
+    devices.list_devices()
+    portaudio.devices.append(_raw("USB Headset"))
+    portaudio.clock.now += devices.DEVICE_CACHE_TTL
+
+    names = [d.name for d in devices.list_devices()]
+
+    assert portaudio.calls == 2
+    assert names[-1] == "USB Headset"
+
+
+def test_invalidate_device_cache_forces_requery(portaudio):
+    devices.list_devices()
+    portaudio.devices = [_raw("USB Headset")]
+
+    devices.invalidate_device_cache()
+
+    assert [d.name for d in devices.list_devices()] == ["USB Headset"]
+    assert portaudio.calls == 2
+
+
+def test_callers_cannot_mutate_cached_list(portaudio):
+    devices.list_devices().clear()
+
+    assert len(devices.list_devices()) == 2
+    assert portaudio.calls == 1
+
+
+def test_query_device_info_shares_the_raw_enumeration(portaudio):
+    devices.list_devices()
+
+    assert devices.query_device_info(1)["name"] == "Virtual Cable 1"
+    assert portaudio.calls == 1
+
+
+def test_best_loopback_is_reused_for_the_same_snapshot(portaudio, monkeypatch):
+    picks = []
+    select = devices._select_best_loopback
+
+    def counting_select(device_list):
+        picks.append(len(device_list))
+        return select(device_list)
+
+    monkeypatch.setattr(devices, "_select_best_loopback", counting_select)
+
+    best = devices.find_best_loopback_device()
+    again = devices.find_best_loopback_device()
+
+    assert best is not None and best.name == "Virtual Cable 1"
+    assert again is best
+    assert len(picks) == 1
+
+    portaudio.clock.now += devices.DEVICE_CACHE_TTL
+    devices.find_best_loopback_device()
+    assert len(picks) == 2
+
+    devices.invalidate_loopback_cache()
+    devices.find_best_loopback_device()
+    assert len(picks) == 3
+    assert portaudio.calls == 2
+
+
+def test_failed_enumeration_is_not_cached(portaudio, monkeypatch):
+    def broken():
+        portaudio.calls += 1
+        raise RuntimeError("PortAudio not initialized")
+
+    monkeypatch.setattr(devices.sd, "query_devices", broken)
+    assert devices.list_devices() == []
+
+    monkeypatch.setattr(devices.sd, "query_devices", lambda: [_raw("Recovered Mic")])
+    assert [d.name for d in devices.list_devices()] == ["Recovered Mic"]
@@ -0,0 +1,74 @@
+# pyright: reportMissingImports=false
+
+from __future__ import annotations
+
+import types
+
+import pytest
+
+from voicelink import devices, platform_utils
+from voicelink.platform_utils import DriverStatus, Platform
+
+
+@pytest.fixture
+def driver_checks(monkeypatch):
+    """Count real driver checks and control the cache clock."""
+    state = types.SimpleNamespace(calls=0, now=500.0, installed=False)
+
+    def check() -> DriverStatus:
+        state.calls += 1
+        return DriverStatus(installed=state.installed, driver_name="BlackHole")
+
+    monkeypatch.setattr(platform_utils, "_check_driver_status", check)
+    monkeypatch.setattr(
+        platform_utils, "time", types.SimpleNamespace(monotonic=lambda: state.now)
+    )
+    platform_utils.invalidate_driver_status()
+    yield state
+    platform_utils.invalidate_driver_status()
+
+
+def test_status_is_reused_within_ttl(driver_checks):
+    first = platform_utils.get_driver_status()
+    driver_checks.now += platform_utils.DRIVER_STATUS_TTL / 2
+
+    assert platform_utils.get_driver_status() is first
+    assert driver_checks.calls == 1
+
+
+def test_status_is_rechecked_after_ttl(driver_checks):
+    platform_utils.get_driver_status()
+    driver_checks.installed = True
+    driver_checks.now += platform_utils.DRIVER_STATUS_TTL
+
+    assert platform_utils.get_driver_status().installed
+    assert driver_checks.calls == 2
+
+
+def test_invalidate_driver_status_forces_recheck(driver_checks):
+    platform_utils.get_driver_status()
+    driver_checks.installed = True
+
+    platform_utils.invalidate_driver_status()
+
+    assert platform_utils.get_driver_status().installed
+    assert driver_checks.calls == 2
+
+
+def test_setup_driver_rechecks_after_install(driver_checks, monkeypatch):
+    invalidated = []
+    monkeypatch.setattr(platform_utils, "get_platform", lambda: Platform.MACOS)
+    monkeypatch.setattr("builtins.input", lambda prompt="": "y")
+
+    def install() -> bool:
+        driver_checks.installed = True
+        return True
+
+    monkeypatch.setattr(platform_utils, "install_blackhole", install)
+    monkeypatch.setattr(devices, "invalidate_device_cache", lambda: invalidated.append(True))
+
+    status = platform_utils.setup_driver(auto_install=True)
+
+    assert status.installed
+    assert driver_checks.calls == 2
+    assert invalidated == [True]
@@ -0,0 +1,110 @@
+# pyright: reportMissingImports=false
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from voicelink.capture import SPSCRingBuffer
+
+
+def _block(value: float, frames: int = 4, channels: int = 1) -> np.ndarray:
+    return np.full((frames, channels), value, dtype=np.float32)
+
+
+def _values(blocks: list[np.ndarray]) -> list[float]:
+    return [float(v) for b in blocks for v in b[:, 0]]
+
+
+def test_push_then_pop_returns_blocks_in_order():
+    ring = SPSCRingBuffer(4, 4, 1, "float32")
+    for i in range(3):
+        assert ring.push(_block(i))
+
+    assert len(ring) == 3
+    popped = [ring.pop() for _ in range(3)]
+    assert [b[0, 0] for b in popped] == [0, 1, 2]
+    assert ring.pop() is None
+
+
+def test_pop_returns_a_copy():
+    ring = SPSCRingBuffer(2, 4, 1, "float32")
+    ring.push(_block(1.0))
+    data = ring.pop()
+    ring.push(_block(2.0))
+    ring.push(_block(3.0))
+    assert data[0, 0] == 1.0
+
+
+def test_drain_releases_everything_at_once():
+    ring = SPSCRingBuffer(4, 4, 2, "float32")
+    for i in range(4):
+        ring.push(_block(i, channels=2))
+
+    blocks = ring.drain()
+    assert [b.shape for b in blocks] == [(4, 2)] * 4
+    assert [b[0, 0] for b in blocks] == [0, 1, 2, 3]
+    assert len(ring) == 0
+    assert ring.drain() == []
+
+
+def test_overrun_spills_instead_of_dropping():
+    ring = SPSCRingBuffer(4, 4, 1, "float32")
+    accepted = [ring.push(_block(i)) for i in range(12)]
+
+    assert accepted == [True] * 4 + [False] * 8
+    assert ring.overruns == 8
+    assert len(ring) == 12
+    assert [b[0, 0] for b in ring.drain()] == list(range(12))
+
+
+def test_spill_keeps_order_while_consumer_catches_up():
+    ring = SPSCRingBuffer(2, 4, 1, "float32")
+    for i in range(3):
+        ring.push(_block(i))
+    # Room in the ring again, but block 2 spilled; 3 must not overtake it
+    assert ring.pop()[0, 0] == 0
+    ring.push(_block(3))
+
+    assert [ring.pop()[0, 0] for _ in range(3)] == [1, 2, 3]
+    # Spill drained: the ring is used again
+    assert ring.push(_block(4))
+    assert ring.overruns == 2
+
+
+def test_oversized_block_spills():
+    ring = SPSCRingBuffer(4, 4, 1, "float32")
+    assert not ring.push(_block(1.0, frames=8))
+    assert ring.pop().shape == (8, 1)
+
+
+@pytest.mark.parametrize("publish_every", [2, 3])
+def test_publish_every_batches_blocks(publish_every):
+    ring = SPSCRingBuffer(4, 4, 1, "float32", publish_every=publish_every)
+    for i in range(publish_every - 1):
+        ring.push(_block(i))
+    # Nothing is visible until the batch is complete
+    assert ring.pop() is None
+
+    ring.push(_block(publish_every - 1))
+    batch = ring.pop()
+    assert batch.shape == (4 * publish_every, 1)
+    assert _values([batch]) == [float(i) for i in range(publish_every) for _ in range(4)]
+
+
+def test_flush_publishes_partial_batch():
+    ring = SPSCRingBuffer(4, 4, 1, "float32", publish_every=4)
+    ring.push(_block(1.0))
+    ring.push(_block(2.0))
+    ring.flush()
+
+    assert _values(ring.drain()) == [1.0] * 4 + [2.0] * 4
+
+
+def test_clear_discards_ring_and_spill():
+    ring = SPSCRingBuffer(2, 4, 1, "float32")
+    for i in range(5):
+        ring.push(_block(i))
+    ring.clear()
+    assert len(ring) == 0
+    assert ring.pop() is None
@@ -0,0 +1,99 @@
+# pyright: reportMissingImports=false
+
+from __future__ import annotations
+
+import types
+
+import pytest
+
+from voicelink import auto_detect
+from voicelink.devices import AudioDevice
+
+
+def _device(index: int) -> AudioDevice:
+    return AudioDevice(
+        index=index,
+        name=f"Device {index}",
+        max_input_channels=2,
+        max_output_channels=0,
+        default_samplerate=48000.0,
+        is_input=True,
+        is_output=False,
+    )
+
+
+@pytest.fixture
+def scans(monkeypatch):
+    """Count real scans and control the cache clock."""
+    state = types.SimpleNamespace(calls=[], now=100.0, result=_device(3))
+
+    def scan(**kwargs):
+        state.calls.append(kwargs)
+        return state.result
+
+    monkeypatch.setattr(auto_detect, "_scan_for_active_device", scan)
+    monkeypatch.setattr(
+        auto_detect, "time", types.SimpleNamespace(monotonic=lambda: state.now)
+    )
+    auto_detect.invalidate_scan_cache()
+    yield state
+    auto_detect.invalidate_scan_cache()
+
+
+def test_result_is_reused_within_cache_seconds(scans):
+    first = auto_detect.find_active_audio_device(verbose=False, cache_seconds=10)
+    scans.now += 9.9
+    second = auto_detect.find_active_audio_device(verbose=False, cache_seconds=10)
+
+    assert second is first
+    assert len(scans.calls) == 1
+
+
+def test_result_expires_after_cache_seconds(scans):
+    auto_detect.find_active_audio_device(verbose=False, cache_seconds=10)
+    scans.result = _device(5)
+    scans.now += 10
+
+    device = auto_detect.find_active_audio_device(verbose=False, cache_seconds=10)
+
+    assert device is not None and device.index == 5
+    assert len(scans.calls) == 2
+
+
+def test_zero_cache_seconds_always_rescans(scans):
+    auto_detect.find_active_audio_device(verbose=False)
+    auto_detect.find_active_audio_device(verbose=False)
+
+    assert len(scans.calls) == 2
+    # The fresh result is still stored for callers that opt into caching.
+    auto_detect.find_active_audio_device(verbose=False, cache_seconds=10)
+    assert len(scans.calls) == 2
+
+
+def test_different_arguments_do_not_share_results(scans):
+    auto_detect.find_active_audio_device(verbose=False, cache_seconds=10)
+    auto_detect.find_active_audio_device(
+        verbose=False, cache_seconds=10, exclude_indices=[3]
+    )
+    auto_detect.find_active_audio_device(verbose=False, cache_seconds=10, threshold=0.01)
+
+    assert len(scans.calls) == 3
+
+
+def test_no_device_result_is_cached(scans):
+    scans.result = None
+
+    assert auto_detect.find_active_audio_device(verbose=False, cache_seconds=10) is None
+    assert auto_detect.find_active_audio_device(verbose=False, cache_seconds=10) is None
+    assert len(scans.calls) == 1
+
+
+def test_invalidate_scan_cache_forces_rescan(scans):
+    auto_detect.find_active_audio_device(verbose=False, cache_seconds=10)
+    scans.result = _device(7)
+
+    auto_detect.invalidate_scan_cache()
+    device = auto_detect.find_active_audio_device(verbose=False, cache_seconds=10)
+
+    assert device is not None and device.index == 7
+    assert len(scans.calls) == 2
@@ -0,0 +1,89 @@
+# pyright: reportMissingImports=false
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from voicelink import session as session_module
+from voicelink.session import Session, SessionManager
+
+NOW = datetime(2024, 5, 17, 15, 30, 0)
+
+
+class _FixedDatetime(datetime):
+    @classmethod
+    def now(cls, tz=None):
+        return NOW
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    monkeypatch.setattr(session_module, "datetime", _FixedDatetime)
+    return SessionManager(tmp_path)
+
+
+def _save(manager: SessionManager, start: datetime, **fields) -> Session:
+    session = Session.create_new(start)
+    for name, value in fields.items():
+        setattr(session, name, value)
+    manager.save_session(session)
+    return session
+
+
+def test_summary_matches_separate_queries(manager, tmp_path):
+    midnight = NOW.replace(hour=0, minute=0, second=0)
+    _save(manager, midnight)
+    _save(manager, NOW - timedelta(hours=1), status="completed",
+          transcription_status="completed")
+    _save(manager, midnight - timedelta(seconds=1), status="completed")
+    _save(manager, midnight + timedelta(days=1))
+    (tmp_path / "chunk.wav").write_bytes(b"\0" * 2048)
+
+    sessions, stats = manager.get_today_summary()
+
+    expected = manager.get_today_sessions()
+    assert [s.session_id for s in sessions] == [s.session_id for s in expected]
+    assert stats == manager.get_stats()
+
+
+def test_summary_filters_to_today_and_orders_newest_first(manager):
+    midnight = NOW.replace(hour=0, minute=0, second=0)
+    early = _save(manager, midnight)
+    late = _save(manager, NOW - timedelta(minutes=5))
+    _save(manager, midnight - timedelta(seconds=1))
+    _save(manager, midnight + timedelta(days=1))
+
+    sessions, _ = manager.get_today_summary()
+
+    assert [s.session_id for s in sessions] == [late.session_id, early.session_id]
+
+
+def test_summary_counts_all_sessions(manager, tmp_path):
+    _save(manager, NOW)
+    _save(manager, NOW - timedelta(days=3), status="completed",
+          transcription_status="completed")
+    (tmp_path / "2024-05-17").mkdir()
+    (tmp_path / "2024-05-17" / "a.wav").write_bytes(b"\0" * 1024)
+
+    _, stats = manager.get_today_summary()
+
+    assert stats["total_sessions"] == 2
+    assert stats["recording_sessions"] == 1
+    assert stats["transcribed_sessions"] == 1
+    assert stats["disk_usage_bytes"] == 1024
+    assert stats["disk_usage_mb"] == pytest.approx(1024 / (1024 * 1024))
+
+
+def test_summary_on_empty_store(manager):
+    sessions, stats = manager.get_today_summary()
+
+    assert sessions == []
+    assert stats == {
+        "total_sessions": 0,
+        "recording_sessions": 0,
+        "transcribed_sessions": 0,
+        "disk_usage_bytes": 0,
+        "disk_usage_mb": 0.0,
+    }
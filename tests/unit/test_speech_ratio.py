@@ -0,0 +1,167 @@
+# pyright: reportMissingImports=false
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from voicelink import chunked_recorder
+from voicelink.chunked_recorder import (
+    VAD_FRAME_MS,
+    VAD_ZCR_MAX,
+    VAD_ZCR_MIN,
+    ChunkedRecorder,
+    _analyze_i16,
+    _analyze_i16_numpy,
+)
+from voicelink.config import VoiceLinkConfig
+
+SAMPLE_RATE = 16000
+FRAME_LEN = SAMPLE_RATE * VAD_FRAME_MS // 1000
+DEFAULT_THRESHOLD = VoiceLinkConfig().recording.silence_threshold
+ENERGY_THRESH = (DEFAULT_THRESHOLD * 32767) ** 2
+
+
+def _speech_like(seconds: float = 3.0) -> np.ndarray:
+    """Voiced harmonic source at 140 Hz gated by a 3 Hz syllable envelope."""
+    rng = np.random.default_rng(0)
+    t = np.arange(int(SAMPLE_RATE * seconds)) / SAMPLE_RATE
+    source = sum(np.sin(2 * np.pi * 140 * k * t) / k for k in range(1, 6))
+    envelope = np.clip(np.sin(2 * np.pi * 3 * t), 0.0, None)
+    signal = 8000 * envelope * source + rng.normal(0, 20, t.size)
+    return np.clip(signal, -32768, 32767).astype(np.int16)
+
+
+def _white_noise(seconds: float = 3.0) -> np.ndarray:
+    rng = np.random.default_rng(1)
+    signal = rng.normal(0, 3000, int(SAMPLE_RATE * seconds))
+    return np.clip(signal, -32768, 32767).astype(np.int16)
+
+
+def _silence(seconds: float = 3.0) -> np.ndarray:
+    return np.zeros(int(SAMPLE_RATE * seconds), dtype=np.int16)
+
+
+FIXTURES = {
+    "speech": _speech_like,
+    "noise": _white_noise,
+    "silence": _silence,
+}
+
+
+def _run(kernel, x: np.ndarray, frame_len: int = FRAME_LEN):
+    voiced = np.empty(len(x) // frame_len, dtype=np.bool_)
+    rms, ratio = kernel(x, frame_len, ENERGY_THRESH, VAD_ZCR_MIN, VAD_ZCR_MAX, voiced)
+    return float(rms), float(ratio), voiced
+
+
+@pytest.fixture
+def recorder(tmp_path):
+    config = VoiceLinkConfig()
+    config.storage.data_dir = str(tmp_path)
+    config.recording.sample_rate = SAMPLE_RATE
+    return ChunkedRecorder(config=config)
+
+
+@pytest.mark.parametrize("name", sorted(FIXTURES))
+def test_numba_kernel_matches_numpy_fallback(name):
+    if _analyze_i16 is _analyze_i16_numpy:
+        pytest.skip("numba is not installed")
+    x = FIXTURES[name]()
+
+    rms_jit, ratio_jit, voiced_jit = _run(_analyze_i16, x)
+    rms_np, ratio_np, voiced_np = _run(_analyze_i16_numpy, x)
+
+    np.testing.assert_array_equal(voiced_jit, voiced_np)
+    assert ratio_jit == ratio_np
+    assert rms_jit == pytest.approx(rms_np, rel=1e-4, abs=1e-9)
+
+
+@pytest.mark.parametrize("kernel", [_analyze_i16, _analyze_i16_numpy])
+def test_fixtures_are_classified_at_default_threshold(kernel):
+    _, speech_ratio, _ = _run(kernel, _speech_like())
+    _, noise_ratio, _ = _run(kernel, _white_noise())
+    rms, silence_ratio, voiced = _run(kernel, _silence())
+
+    # The envelope is open for half of each cycle, so roughly half the frames are voiced.
+    assert 0.3 <= speech_ratio <= 0.7
+    # Loud white noise passes the energy gate but its ZCR (~0.5) is above VAD_ZCR_MAX.
+    assert noise_ratio == 0.0
+    assert rms == 0.0
+    assert silence_ratio == 0.0
+    assert not voiced.any()
+
+
+@pytest.mark.parametrize("kernel", [_analyze_i16, _analyze_i16_numpy])
+@pytest.mark.parametrize("frame_len", [0, 1])
+def test_kernels_reject_frames_too_short_for_zcr(kernel, frame_len):
+    x = _speech_like(0.01)
+    voiced = np.ones(4, dtype=np.bool_)
+
+    rms, ratio = kernel(x, frame_len, 0.0, VAD_ZCR_MIN, VAD_ZCR_MAX, voiced)
+
+    assert ratio == 0.0
+    assert rms > 0.0
+    assert not voiced.any()
+
+
+@pytest.mark.parametrize("kernel", [_analyze_i16, _analyze_i16_numpy])
+def test_kernels_handle_empty_input(kernel):
+    voiced = np.empty(0, dtype=np.bool_)
+
+    rms, ratio = kernel(np.zeros(0, dtype=np.int16), FRAME_LEN, 0.0, 0.0, 1.0, voiced)
+
+    assert (rms, ratio) == (0.0, 0.0)
+
+
+def test_analyze_chunk_with_sub_frame_sample_rate(recorder):
+    recorder._sr = 40  # 30 ms is a single sample
+
+    rms, ratio, voiced = recorder._analyze_chunk(_speech_like(0.1))
+
+    assert rms > 0.0
+    assert ratio == 0.0
+    assert len(voiced) == 0
+
+
+def test_speech_ratio_without_webrtcvad_uses_heuristic(recorder, monkeypatch):
+    monkeypatch.setattr(chunked_recorder, "webrtcvad", None)
+    x = _speech_like()
+
+    _, expected, _ = _run(_analyze_i16_numpy, x)
+
+    assert recorder._calculate_speech_ratio(x) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("name", ["speech", "silence"])
+def test_silence_decision_matches_webrtcvad(recorder, name):
+    webrtcvad = pytest.importorskip("webrtcvad")
+    x = FIXTURES[name]()
+    vad = webrtcvad.Vad(3)
+    pcm = x.tobytes()
+    frame_bytes = FRAME_LEN * 2
+    n_frames = len(x) // FRAME_LEN
+    reference = sum(
+        vad.is_speech(pcm[i * frame_bytes:(i + 1) * frame_bytes], SAMPLE_RATE)
+        for i in range(n_frames)
+    ) / n_frames
+
+    ratio = recorder._calculate_speech_ratio(x)
+
+    assert (ratio < 0.05) == (reference < 0.05)
+
+
+def test_webrtcvad_refinement_only_removes_frames(recorder):
+    pytest.importorskip("webrtcvad")
+    if chunked_recorder.webrtcvad is None:
+        pytest.skip("chunked_recorder was imported without webrtcvad")
+    # Keep only the first syllable so the heuristic ratio lands in VAD_REFINE_RANGE.
+    x = _speech_like()
+    x[int(SAMPLE_RATE * 0.2):] = 0
+
+    analysis = recorder._analyze_chunk(x)
+    _, heuristic, _ = analysis
+    lo, hi = chunked_recorder.VAD_REFINE_RANGE
+    assert lo <= heuristic <= hi
+
+    assert recorder._calculate_speech_ratio(x, analysis) <= heuristic
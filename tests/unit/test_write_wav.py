@@ -0,0 +1,108 @@
+# pyright: reportMissingImports=false
+
+from __future__ import annotations
+
+import os
+import wave
+
+import numpy as np
+import pytest
+
+from voicelink import chunked_recorder
+from voicelink.chunked_recorder import _WAV_HEADER, _write_wav
+
+
+def _audio(frames: int, channels: int) -> np.ndarray:
+    rng = np.random.default_rng(frames + channels)
+    data = rng.integers(-32768, 32768, size=(frames, channels), dtype=np.int16)
+    return data if channels > 1 else data[:, 0]
+
+
+def _read(path) -> tuple:
+    with wave.open(str(path), "rb") as wf:
+        params = wf.getparams()
+        frames = wf.readframes(params.nframes)
+    return params, np.frombuffer(frames, dtype=np.int16)
+
+
+@pytest.mark.parametrize("channels", [1, 2])
+@pytest.mark.parametrize("sample_rate", [16000, 48000])
+def test_header_round_trips_through_wave(tmp_path, channels, sample_rate):
+    audio = _audio(1234, channels)
+    path = tmp_path / "chunk.wav"
+
+    _write_wav(path, audio, sample_rate, channels)
+
+    params, data = _read(path)
+    assert params.nchannels == channels
+    assert params.sampwidth == 2
+    assert params.framerate == sample_rate
+    assert params.nframes == 1234
+    assert params.comptype == "NONE"
+    np.testing.assert_array_equal(data, audio.ravel())
+    assert path.stat().st_size == _WAV_HEADER.size + audio.nbytes
+
+
+def test_reused_header_buffer_is_overwritten(tmp_path):
+    header = bytearray(_WAV_HEADER.size)
+    first = tmp_path / "first.wav"
+    second = tmp_path / "second.wav"
+
+    _write_wav(first, _audio(100, 2), 48000, 2, header)
+    _write_wav(second, _audio(50, 1), 16000, 1, header)
+
+    params, _ = _read(second)
+    assert (params.nchannels, params.framerate, params.nframes) == (1, 16000, 50)
+    assert _read(first)[0].nframes == 100
+
+
+def test_non_contiguous_input_is_written_in_order(tmp_path):
+    stereo = _audio(200, 2)
+    left = stereo[:, 0]
+    path = tmp_path / "left.wav"
+
+    _write_wav(path, left, 16000, 1)
+
+    np.testing.assert_array_equal(_read(path)[1], left)
+
+
+def test_empty_audio_writes_header_only(tmp_path):
+    path = tmp_path / "empty.wav"
+
+    _write_wav(path, np.zeros(0, dtype=np.int16), 16000, 1)
+
+    params, data = _read(path)
+    assert params.nframes == 0
+    assert data.size == 0
+
+
+@pytest.mark.skipif(not hasattr(os, "writev"), reason="os.writev is not available")
+def test_short_writev_writes_are_resumed(tmp_path, monkeypatch):
+    real_writev = os.writev
+
+    def short_writev(fd, buffers):
+        # Write at most 7 bytes per call to exercise the partial-write loop.
+        first = bytes(buffers[0])[:7]
+        return real_writev(fd, [first])
+
+    monkeypatch.setattr(chunked_recorder.os, "writev", short_writev)
+    audio = _audio(300, 2)
+    path = tmp_path / "short.wav"
+
+    _write_wav(path, audio, 16000, 2)
+
+    params, data = _read(path)
+    assert params.nframes == 300
+    np.testing.assert_array_equal(data, audio.ravel())
+
+
+def test_fallback_without_writev(tmp_path, monkeypatch):
+    monkeypatch.delattr(chunked_recorder.os, "writev", raising=False)
+    audio = _audio(300, 2)
+    path = tmp_path / "fallback.wav"
+
+    _write_wav(path, audio, 44100, 2)
+
+    params, data = _read(path)
+    assert (params.nchannels, params.framerate) == (2, 44100)
+    np.testing.assert_array_equal(data, audio.ravel())
@@ -4,67 +4,105 @@ A Python tool for capturing system audio (Zoom calls, YouTube, etc.) that works
 as both a standalone Python program and a Claude Skill.
 """
 
+from __future__ import annotations
+
+import importlib
 from pathlib import Path
-from typing import Callable, Optional, Union
-
-from .auto_detect import (
-    DeviceProbeResult,
-    auto_select_capture_device,
-    find_active_audio_device,
-    probe_device,
-)
-from .capture import AudioCapture, CaptureConfig, capture_audio_sync
-from .devices import (
-    AudioDevice,
-    find_best_loopback_device,
-    get_device_by_index,
-    get_device_by_name,
-    list_capture_devices,
-    list_devices,
-    list_loopback_devices,
-)
-from .logging_config import get_logger, log, setup_logging
-from .platform_utils import (
-    Platform,
-    check_blackhole_installed,
-    get_driver_status,
-    get_platform,
-    get_system_info,
-    setup_driver,
-)
-from .recorder import AudioRecorder, RecordingConfig, record_audio
-from .virtual_mic import (
-    VirtualMicRouter,
-    check_virtual_mic_ready,
-    find_virtual_mic_devices,
-    get_virtual_mic_setup_instructions,
-)
-
-# Optional imports (require extra dependencies)
-try:
-    from .vad import (
-        VADConfig,
-        extract_voice_segments,
-        is_silent,
-        process_wav_file,
-        remove_silence,
-    )
-    _VAD_AVAILABLE = True
-except ImportError:
-    _VAD_AVAILABLE = False
-
-try:
-    from .whisper import (
-        TranscriptionResult,
-        WhisperConfig,
-        get_optimal_sample_rate,
-        prepare_audio_for_whisper,
-        transcribe_audio,
-        transcribe_directory,
-    )
-    _WHISPER_AVAILABLE = True
-except ImportError:
-    _WHISPER_AVAILABLE = False
+from typing import TYPE_CHECKING, Any, Callable, Optional, Union
+
+if TYPE_CHECKING:
+    from .capture import AudioCapture
+    from .devices import AudioDevice
+    from .recorder import AudioRecorder
+
+# Public names are resolved on first access (PEP 562) so that importing the
+# package, or a single submodule such as voicelink.cli, does not pull in every
+# backend. Maps attribute name -> submodule that defines it.
+_LAZY: dict[str, str] = {
+    # Auto Detection
+    "AudioProbePool": ".auto_detect",
+    "DeviceProbeResult": ".auto_detect",
+    "auto_select_capture_device": ".auto_detect",
+    "find_active_audio_device": ".auto_detect",
+    "probe_device": ".auto_detect",
+    # Capture
+    "AudioCapture": ".capture",
+    "CaptureConfig": ".capture",
+    "capture_audio_sync": ".capture",
+    # Devices
+    "AudioDevice": ".devices",
+    "find_best_loopback_device": ".devices",
+    "get_device_by_index": ".devices",
+    "get_device_by_name": ".devices",
+    "list_capture_devices": ".devices",
+    "list_devices": ".devices",
+    "list_loopback_devices": ".devices",
+    # Logging
+    "get_logger": ".logging_config",
+    "log": ".logging_config",
+    "setup_logging": ".logging_config",
+    # Platform
+    "Platform": ".platform_utils",
+    "check_blackhole_installed": ".platform_utils",
+    "get_driver_status": ".platform_utils",
+    "get_platform": ".platform_utils",
+    "get_system_info": ".platform_utils",
+    "setup_driver": ".platform_utils",
+    # Recording
+    "AudioRecorder": ".recorder",
+    "RecordingConfig": ".recorder",
+    "record_audio": ".recorder",
+    # Virtual Mic
+    "VirtualMicRouter": ".virtual_mic",
+    "check_virtual_mic_ready": ".virtual_mic",
+    "find_virtual_mic_devices": ".virtual_mic",
+    "get_virtual_mic_setup_instructions": ".virtual_mic",
+    # VAD (optional: requires webrtcvad)
+    "VADConfig": ".vad",
+    "extract_voice_segments": ".vad",
+    "is_silent": ".vad",
+    "process_wav_file": ".vad",
+    "remove_silence": ".vad",
+    # Whisper (optional)
+    "TranscriptionResult": ".whisper",
+    "WhisperConfig": ".whisper",
+    "get_optimal_sample_rate": ".whisper",
+    "prepare_audio_for_whisper": ".whisper",
+    "transcribe_audio": ".whisper",
+    "transcribe_directory": ".whisper",
+}
+
+# Availability flags for the optional submodules.
+_OPTIONAL = {"_VAD_AVAILABLE": ".vad", "_WHISPER_AVAILABLE": ".whisper"}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _OPTIONAL:
+        try:
+            importlib.import_module(_OPTIONAL[name], __name__)
+            value: Any = True
+        except (ImportError, OSError):
+            value = False
+    else:
+        try:
+            module_name = _LAZY[name]
+        except KeyError:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+        try:
+            module = importlib.import_module(module_name, __name__)
+        except (ImportError, OSError) as e:
+            # OSError: a native library (e.g. PortAudio) failed to load
+            raise AttributeError(
+                f"{name!r} requires optional dependencies that are not installed: {e}"
+            ) from e
+        value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY))
+
 
 __version__ = "0.1.0"
 __all__ = [
@@ -99,6 +137,7 @@ __all__ = [
     "find_virtual_mic_devices",
     "get_virtual_mic_setup_instructions",
     # Auto Detection
+    "AudioProbePool",
     "DeviceProbeResult",
     "find_active_audio_device",
     "auto_select_capture_device",
@@ -151,6 +190,8 @@ class VoiceLink:
         
         # 자동 탐지 모드일 경우 활성 장치 찾기
         if auto_detect and device is None:
+            from .auto_detect import auto_select_capture_device
+
             detected = auto_select_capture_device(verbose=True)
             if detected:
                 self._default_device = detected.index
@@ -162,6 +203,8 @@ class VoiceLink:
         Returns:
             List of AudioDevice objects.
         """
+        from .devices import list_devices
+
         return list_devices()
 
     @staticmethod
@@ -171,6 +214,8 @@ class VoiceLink:
         Returns:
             List of loopback/virtual AudioDevice objects.
         """
+        from .devices import list_loopback_devices
+
         return list_loopback_devices()
 
     @staticmethod
@@ -180,6 +225,8 @@ class VoiceLink:
         Returns:
             Best AudioDevice for loopback capture, or None.
         """
+        from .devices import find_best_loopback_device
+
         return find_best_loopback_device()
 
     @staticmethod
@@ -194,18 +241,26 @@ class VoiceLink:
         Returns:
             AudioDevice with active signal, or None.
         """
+        from .auto_detect import find_active_audio_device
+
         return find_active_audio_device(verbose=verbose)
 
-    def detect_and_set_device(self, verbose: bool = True) -> Optional[AudioDevice]:
+    def detect_and_set_device(
+        self, verbose: bool = True, cache_seconds: float = 0.0
+    ) -> Optional[AudioDevice]:
         """Detect active audio device and set it as default.
 
         Args:
             verbose: Print scanning progress.
+            cache_seconds: Reuse a scan result from the last N seconds
+                instead of probing every device again.
 
         Returns:
             Detected AudioDevice, or None.
         """
-        device = auto_select_capture_device(verbose=verbose)
+        from .auto_detect import auto_select_capture_device
+
+        device = auto_select_capture_device(verbose=verbose, cache_seconds=cache_seconds)
         if device:
             self._default_device = device.index
         return device
@@ -217,6 +272,9 @@ class VoiceLink:
         Returns:
             Dictionary with setup status information.
         """
+        from .platform_utils import get_driver_status, get_platform
+        from .virtual_mic import check_virtual_mic_ready
+
         driver = get_driver_status()
         mic_status = check_virtual_mic_ready()
 
@@ -240,6 +298,8 @@ class VoiceLink:
         Returns:
             True if drivers are installed after setup.
         """
+        from .platform_utils import setup_driver
+
         status = setup_driver(auto_install=auto_install)
         return status.installed
 
@@ -263,6 +323,8 @@ class VoiceLink:
         Returns:
             Path to saved file, or None on error.
         """
+        from .recorder import record_audio
+
         return record_audio(
             output_path=output_path,
             duration=duration,
@@ -288,10 +350,13 @@ class VoiceLink:
         Returns:
             True if capture started successfully.
         """
+        from .capture import AudioCapture, CaptureConfig
+
         config = CaptureConfig(
             device=self._default_device,
             sample_rate=sample_rate,
             channels=channels,
+            enable_queue=False,  # consumed via callback only
         )
         self._capture = AudioCapture(config)
 
@@ -356,6 +421,8 @@ class VoiceLink:
         Returns:
             List of device dictionaries.
         """
+        from .devices import list_devices
+
         devices = list_devices()
         return [
             {
@@ -420,6 +487,9 @@ class VoiceLink:
         Returns:
             Status dictionary.
         """
+        from .platform_utils import get_driver_status, get_platform
+        from .virtual_mic import check_virtual_mic_ready
+
         return {
             "platform": get_platform().value,
             "driver_status": get_driver_status().__dict__,
@@ -4,17 +4,179 @@
 """
 
 import logging
+import math
+import re
+import threading
 import time
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
 from typing import Optional
 
 import numpy as np
 import sounddevice as sd
 
-from .devices import AudioDevice, list_devices
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+from .devices import AudioDevice, list_devices, query_device_info
 
 logger = logging.getLogger(__name__)
 
+# 최근 탐지 결과 캐시: 스캔 인자 -> (time.monotonic() 시각, 결과 장치)
+_scan_cache: dict[tuple, tuple[float, Optional[AudioDevice]]] = {}
+
+# 동시에 프로브할 최대 장치 수
+DEFAULT_PROBE_WORKERS = 4
+
+# 조기 종료 판단 전에 받아야 하는 최소 블록 수 (순간적인 잡음 방지)
+MIN_PROBE_BLOCKS = 3
+
+# PortAudio 스트림 open/close는 스레드 안전이 보장되지 않으므로
+# (WASAPI exclusive, ALSA hw 등에서 실패/교착) 한 번에 하나씩만 수행.
+# 병렬 프로브는 스트림을 연 뒤 데이터를 기다리는 부분만 겹칩니다.
+_stream_open_lock = threading.Lock()
+
+
+def _rms_peak_numpy(x: np.ndarray) -> tuple[float, float]:
+    """블록의 제곱합과 peak (NumPy 버전)."""
+    flat = x.ravel()
+    # float32 그대로 내적/최솟값/최댓값을 구해 float64 임시 배열과 abs() 사본을 만들지 않음
+    return float(np.dot(flat, flat)), max(-float(flat.min()), float(flat.max()))
+
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _rms_peak(x):
+        """제곱합과 peak를 한 번의 루프로 계산 (Numba 버전)."""
+        ss = 0.0
+        pk = 0.0
+        for i in range(x.shape[0]):
+            for c in range(x.shape[1]):
+                v = x[i, c]
+                ss += v * v
+                a = abs(v)
+                if a > pk:
+                    pk = a
+        return ss, pk
+else:
+    _rms_peak = _rms_peak_numpy
+
+_warmed_up = False
+
+
+def warm_up() -> None:
+    """프로브 커널을 미리 컴파일합니다 (한 번만).
+
+    모듈 import 시점이 아니라 첫 프로브 직전에 호출되어, 컴파일이 오디오
+    콜백 안에서 일어나지 않으면서도 import 비용은 늘리지 않습니다.
+    """
+    global _warmed_up
+    if not _warmed_up:
+        _rms_peak(np.zeros((1, 1), dtype=np.float32))
+        _warmed_up = True
+
+
+class AudioProbePool:
+    """장치별 프로브 스트림을 열어 두고 재사용하는 풀.
+    
+    스트림은 처음 프로브할 때 한 번만 열고, 이후에는 start/stop만 반복합니다.
+    반복 스캔 시 PortAudio open/close 비용을 없애줍니다. 사용이 끝나면
+    close_all()을 호출하거나 with 문으로 사용하세요.
+    """
+    
+    def __init__(self):
+        # (장치, 샘플레이트, 채널) -> (스트림, 현재 프로브 콜백 슬롯)
+        self._streams: dict[tuple[int, int, int], tuple[sd.InputStream, list]] = {}
+        self._lock = threading.Lock()
+    
+    def _get_stream(self, key: tuple[int, int, int]) -> tuple[sd.InputStream, list]:
+        with self._lock:
+            entry = self._streams.get(key)
+        if entry is not None:
+            return entry
+        
+        # PortAudio open은 느리므로 락 밖에서 수행 (다른 장치 프로브를 막지 않음)
+        handler: list = [None]
+        
+        def dispatch(indata, frames, time_info, status):
+            callback = handler[0]
+            if callback is not None:
+                callback(indata, frames, time_info, status)
+        
+        device_index, sample_rate, channels = key
+        with _stream_open_lock:
+            stream = sd.InputStream(
+                device=device_index,
+                samplerate=sample_rate,
+                channels=channels,
+                dtype='float32',
+                callback=dispatch,
+                blocksize=1024,
+            )
+        with self._lock:
+            entry = self._streams.setdefault(key, (stream, handler))
+        if entry[0] is not stream:
+            # 같은 키를 다른 스레드가 먼저 열었으면 그쪽을 사용
+            with _stream_open_lock:
+                stream.close()
+        return entry
+    
+    def run_probe(
+        self,
+        device_index: int,
+        sample_rate: int,
+        channels: int,
+        callback,
+        done: threading.Event,
+        duration: float,
+    ) -> None:
+        """풀의 스트림으로 최대 duration초 동안 callback에 오디오를 전달합니다."""
+        key = (device_index, sample_rate, channels)
+        stream, handler = self._get_stream(key)
+        handler[0] = callback
+        try:
+            stream.start()
+            try:
+                done.wait(duration)
+            finally:
+                stream.stop()
+        except Exception:
+            # 오류가 난 스트림은 재사용하지 않음
+            self._discard(key)
+            raise
+        finally:
+            handler[0] = None
+    
+    def _discard(self, key: tuple[int, int, int]) -> None:
+        with self._lock:
+            entry = self._streams.pop(key, None)
+        if entry is not None:
+            try:
+                with _stream_open_lock:
+                    entry[0].close()
+            except Exception:
+                pass
+    
+    def close_all(self) -> None:
+        """열려 있는 모든 프로브 스트림을 닫습니다."""
+        with self._lock:
+            entries = list(self._streams.values())
+            self._streams.clear()
+        for stream, _ in entries:
+            try:
+                with _stream_open_lock:
+                    stream.close()
+            except Exception as e:
+                logger.debug(f"프로브 스트림 닫기 실패: {e}")
+    
+    def __enter__(self) -> "AudioProbePool":
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close_all()
+
 
 @dataclass
 class DeviceProbeResult:
@@ -32,6 +194,7 @@ def probe_device(
     duration: float = 0.5,
     sample_rate: int = 44100,
     threshold: float = 0.001,
+    probe_pool: Optional[AudioProbePool] = None,
 ) -> Optional[DeviceProbeResult]:
     """단일 장치에서 오디오 신호를 프로브합니다.
     
@@ -40,6 +203,7 @@ def probe_device(
         duration: 프로브 시간 (초)
         sample_rate: 샘플링 레이트
         threshold: 신호 감지 임계값 (RMS)
+        probe_pool: 지정하면 스트림을 새로 열지 않고 풀의 스트림을 재사용
     
     Returns:
         DeviceProbeResult 또는 오류 시 None
@@ -50,31 +214,60 @@ def probe_device(
     if not device or not device.can_capture:
         return None
     
-    audio_data = []
+    # 콜백에서 JIT 컴파일이 일어나지 않도록 스트림을 열기 전에 준비
+    warm_up()
+    
+    # 블록을 모아두지 않고 콜백에서 바로 제곱합/피크를 누적 (메모리 O(1))
+    sum_sq = 0.0
+    n_values = 0
+    peak = 0.0
+    n_blocks = 0
+    threshold_sq = threshold * threshold
+    # 신호가 확실하면 duration을 다 채우지 않고 바로 종료
+    done = threading.Event()
     
     def callback(indata, frames, time_info, status):
-        audio_data.append(indata.copy())
+        nonlocal sum_sq, n_values, peak, n_blocks
+        if indata.size == 0:
+            return
+        block_sum_sq, block_peak = _rms_peak(indata)
+        sum_sq += block_sum_sq
+        n_values += indata.size
+        peak = max(peak, block_peak)
+        n_blocks += 1
+        if n_blocks >= MIN_PROBE_BLOCKS and sum_sq > threshold_sq * n_values:
+            done.set()
     
     try:
         # 장치 정보 조회
-        device_info = sd.query_devices(device_index)
+        device_info = query_device_info(device_index)
         channels = min(2, device_info['max_input_channels'])
         
         if channels <= 0:
             return None
         
         # 짧은 시간 동안 오디오 캡처
-        with sd.InputStream(
-            device=device_index,
-            samplerate=sample_rate,
-            channels=channels,
-            dtype='float32',
-            callback=callback,
-            blocksize=1024,
-        ):
-            time.sleep(duration)
+        if probe_pool is not None:
+            probe_pool.run_probe(device_index, sample_rate, channels, callback, done, duration)
+        else:
+            with _stream_open_lock:
+                stream = sd.InputStream(
+                    device=device_index,
+                    samplerate=sample_rate,
+                    channels=channels,
+                    dtype='float32',
+                    callback=callback,
+                    blocksize=1024,
+                )
+            try:
+                stream.start()
+                done.wait(duration)
+                stream.stop()
+            finally:
+                with _stream_open_lock:
+                    stream.close()
         
-        if not audio_data:
+        if n_values == 0:
             return DeviceProbeResult(
                 device=device,
                 rms_level=0.0,
@@ -84,9 +277,7 @@ def probe_device(
             )
         
         # 오디오 레벨 분석
-        combined = np.concatenate(audio_data, axis=0)
-        rms = float(np.sqrt(np.mean(combined**2)))
-        peak = float(np.max(np.abs(combined)))
+        rms = math.sqrt(sum_sq / n_values)
         
         return DeviceProbeResult(
             device=device,
@@ -106,6 +297,11 @@ def probe_device(
         )
 
 
+def invalidate_scan_cache() -> None:
+    """저장된 탐지 결과를 모두 버려 다음 호출이 장치를 다시 스캔하게 합니다."""
+    _scan_cache.clear()
+
+
 def find_active_audio_device(
     probe_duration: float = 0.5,
     threshold: float = 0.001,
@@ -113,6 +309,9 @@ def find_active_audio_device(
     exclude_keywords: Optional[list[str]] = None,
     exclude_indices: Optional[list[int]] = None,
     verbose: bool = True,
+    cache_seconds: float = 0.0,
+    max_workers: int = DEFAULT_PROBE_WORKERS,
+    probe_pool: Optional[AudioProbePool] = None,
 ) -> Optional[AudioDevice]:
     """실제로 오디오 신호가 있는 장치를 자동으로 찾습니다.
     
@@ -124,24 +323,64 @@ def find_active_audio_device(
         threshold: 신호 감지 임계값 (RMS)
         prefer_virtual: 가상 장치 우선 여부
         verbose: 상세 출력 여부
+        cache_seconds: 같은 인자로 이 시간(초) 이내에 스캔한 결과가 있으면
+            장치를 다시 열지 않고 재사용합니다. 0이면 항상 새로 스캔합니다.
+        max_workers: 동시에 프로브할 장치 수. 1이면 순차 스캔합니다.
+            스트림 open/close는 항상 한 번에 하나씩 수행되고, 신호를
+            기다리는 구간만 병렬로 진행됩니다.
+        probe_pool: 반복 스캔 시 장치 스트림을 재사용할 AudioProbePool
     
     Returns:
         신호가 있는 최적의 AudioDevice, 없으면 None
     """
+    cache_key = (
+        probe_duration,
+        threshold,
+        prefer_virtual,
+        tuple(exclude_keywords or ()),
+        tuple(exclude_indices or ()),
+    )
+    if cache_seconds > 0:
+        cached = _scan_cache.get(cache_key)
+        if cached is not None and time.monotonic() - cached[0] < cache_seconds:
+            if verbose:
+                print("\n🔍 최근 탐지 결과 재사용 (캐시)")
+            return cached[1]
+
+    result = _scan_for_active_device(
+        probe_duration=probe_duration,
+        threshold=threshold,
+        prefer_virtual=prefer_virtual,
+        exclude_keywords=exclude_keywords,
+        exclude_indices=exclude_indices,
+        verbose=verbose,
+        max_workers=max_workers,
+        probe_pool=probe_pool,
+    )
+    _scan_cache[cache_key] = (time.monotonic(), result)
+    return result
+
+
+def _scan_for_active_device(
+    probe_duration: float,
+    threshold: float,
+    prefer_virtual: bool,
+    exclude_keywords: Optional[list[str]],
+    exclude_indices: Optional[list[int]],
+    verbose: bool,
+    max_workers: int = DEFAULT_PROBE_WORKERS,
+    probe_pool: Optional[AudioProbePool] = None,
+) -> Optional[AudioDevice]:
+    """모든 후보 장치를 실제로 프로브하여 활성 장치를 찾습니다."""
     all_devices = list_devices()
     
     # 입력 가능한 장치만 필터링
     input_devices = [d for d in all_devices if d.can_capture]
     
-    # 키워드 기반 제외
+    # 키워드 기반 제외 (키워드를 한 번만 소문자화해 하나의 정규식으로 검사)
     if exclude_keywords:
-        filtered = []
-        for d in input_devices:
-            name_lower = d.name.lower()
-            if any(k in name_lower for k in exclude_keywords):
-                continue
-            filtered.append(d)
-        input_devices = filtered
+        exclude_re = re.compile("|".join(re.escape(k.lower()) for k in exclude_keywords))
+        input_devices = [d for d in input_devices if not exclude_re.search(d.name.lower())]
 
     # 인덱스 기반 제외 (현재 사용 중인 장치 충돌 방지)
     if exclude_indices:
@@ -161,15 +400,29 @@ def find_active_audio_device(
     
     results: list[DeviceProbeResult] = []
     
-    for device in scan_order:
-        if verbose:
-            print(f"  [{device.index:3d}] {device.name[:40]:<40}", end=" ", flush=True)
-        
-        result = probe_device(
+    # 병렬 프로브가 각자 컴파일을 시도하지 않도록 먼저 한 번 준비
+    warm_up()
+    
+    def probe(device: AudioDevice) -> Optional[DeviceProbeResult]:
+        return probe_device(
             device.index,
             duration=probe_duration,
             threshold=threshold,
+            probe_pool=probe_pool,
         )
+    
+    # 장치마다 probe_duration 동안 대기하므로 여러 장치를 동시에 프로브
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+        probed = list(pool.map(probe, scan_order))
+    
+    # 일부 백엔드는 같은 하드웨어 동시 접근을 막으므로 해당 장치만 순차로 재시도
+    for i, (device, result) in enumerate(zip(scan_order, probed)):
+        if result and result.error and "unavailable" in result.error.lower():
+            probed[i] = probe(device)
+    
+    for device, result in zip(scan_order, probed):
+        if verbose:
+            print(f"  [{device.index:3d}] {device.name[:40]:<40}", end=" ", flush=True)
         
         if result:
             results.append(result)
@@ -199,9 +452,9 @@ def find_active_audio_device(
             print(f"\n✅ 활성 장치 발견: [{best.device.index}] {best.device.name}")
             print(f"   RMS: {best.rms_level:.6f}, Peak: {best.peak_level:.6f}")
         
-        # 레코더에서 참조할 수 있도 속성 추가
-        best.device.rms_level = best.rms_level
-        return best.device
+        # 레코더에서 참조할 수 있도록 RMS를 담은 사본을 반환
+        # (list_devices()가 캐시한 AudioDevice는 공유되므로 직접 수정하지 않음)
+        return replace(best.device, rms_level=best.rms_level)
     
     if verbose:
         print("\n⚠️ 활성 오디오 장치를 찾을 수 없습니다.")
@@ -213,6 +466,7 @@ def find_active_audio_device(
 def auto_select_capture_device(
     fallback_to_default: bool = True,
     verbose: bool = True,
+    cache_seconds: float = 0.0,
 ) -> Optional[AudioDevice]:
     """캡처용 장치를 자동으로 선택합니다.
     
@@ -223,6 +477,7 @@ def auto_select_capture_device(
     Args:
         fallback_to_default: 실패 시 기본 장치 사용 여부
         verbose: 상세 출력 여부
+        cache_seconds: 활성 장치 스캔 결과 재사용 시간 (초)
     
     Returns:
         선택된 AudioDevice 또는 None
@@ -236,6 +491,7 @@ def auto_select_capture_device(
         prefer_virtual=True,
         exclude_keywords=["microphone", "mic", "마이크", "webcam", "voicemeeter out b1"],  # 마이크 및 B1 제외
         verbose=verbose,
+        cache_seconds=cache_seconds,
     )
     
     if active_device:
@@ -1,14 +1,24 @@
 """Core audio capture functionality."""
 
-import queue
+import collections
+import ctypes
+import math
+import os
 import threading
+import time
 from dataclasses import dataclass, field
-from typing import Callable, Optional
+from typing import Callable, Optional, Union
 
 import numpy as np
 import sounddevice as sd
 
-from .devices import AudioDevice, find_best_loopback_device, get_device_by_index
+from .devices import (
+    AudioDevice,
+    find_best_loopback_device,
+    get_device_by_index,
+    query_device_info,
+)
+from .platform_utils import Platform, get_platform
 
 
 @dataclass
@@ -20,7 +30,20 @@ class CaptureConfig:
     channels: int = 2
     dtype: str = "float32"
     blocksize: int = 1024
-    latency: str = "low"
+    latency: Union[str, float] = "low"  # "low"/"high" or seconds
+    auto_blocksize: bool = False  # Size blocks from the device latency instead of blocksize
+    # Preallocated ring capacity in blocks (~6 s at 1024 frames / 44.1 kHz).
+    # If the consumer falls further behind, blocks spill into a growable
+    # overflow store instead of being dropped (see CaptureState.overflow_blocks).
+    queue_blocks: int = 256
+    # >0: hand callbacks reused buffers from a pool of this many blocks instead
+    # of a fresh copy per block. Each array is overwritten pool_blocks blocks
+    # later, so only enable this if every callback copies what it keeps.
+    pool_blocks: int = 0
+    enable_queue: bool = True  # Buffer blocks for get_audio_data(); disable if nothing reads them
+    enable_callbacks: bool = True  # Deliver blocks to add_callback() listeners
+    realtime_priority: bool = False  # Raise the audio thread's OS priority (may need privileges)
+    publish_every: int = 1  # Blocks batched per queue entry (fewer consumer wake-ups)
 
 
 @dataclass
@@ -30,9 +53,177 @@ class CaptureState:
     is_capturing: bool = False
     device: Optional[AudioDevice] = None
     samples_captured: int = 0
+    overflow_blocks: int = 0  # Blocks that did not fit in the preallocated ring
     error: Optional[str] = None
 
 
+# Slot size used when blocksize=0 lets PortAudio pick a variable block length.
+_VARIABLE_BLOCK_FRAMES = 4096
+# Most recent callback exceptions kept for drain_errors().
+_ERROR_SLOTS = 16
+
+# (device index, "low"/"high") -> default input latency in seconds
+_latency_cache: dict[tuple[int, str], float] = {}
+
+
+def _device_latency(device_idx: int, kind: str) -> Optional[float]:
+    """Look up a device's default input latency once and remember it."""
+    key = (device_idx, kind)
+    seconds = _latency_cache.get(key)
+    if seconds is None:
+        try:
+            seconds = float(query_device_info(device_idx)[f"default_{kind}_input_latency"])
+        except Exception:
+            return None
+        _latency_cache[key] = seconds
+    return seconds
+
+
+def _raise_current_thread_priority() -> None:
+    """Ask the OS to schedule the calling thread as a realtime audio thread.
+
+    Raises OSError if the platform refuses (e.g. SCHED_FIFO without
+    CAP_SYS_NICE on Linux).
+    """
+    current = get_platform()
+    if current == Platform.LINUX:
+        os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(50))
+    elif current == Platform.WINDOWS:
+        task_index = ctypes.c_ulong(0)
+        if not ctypes.windll.avrt.AvSetMmThreadCharacteristicsW(
+            "Pro Audio", ctypes.byref(task_index)
+        ):
+            raise ctypes.WinError()
+    elif current == Platform.MACOS:
+        qos_class_user_interactive = 0x21
+        libc = ctypes.CDLL("/usr/lib/libSystem.dylib")
+        if libc.pthread_set_qos_class_self_np(qos_class_user_interactive, 0) != 0:
+            raise OSError("pthread_set_qos_class_self_np failed")
+    else:
+        raise OSError("Realtime priority is not supported on this platform")
+
+
+class SPSCRingBuffer:
+    """Fixed-capacity single-producer/single-consumer ring of audio blocks.
+
+    Storage is allocated once up front. The producer (the PortAudio callback)
+    only ever writes ``_head`` and the consumer only ever writes ``_tail``;
+    each is a plain int store, which is atomic under the GIL, so neither side
+    takes a lock. When the ring is full, blocks are copied into an unbounded
+    overflow deque instead (counted in ``overruns``), so a consumer that only
+    drains at the end still gets every block, in order. Once anything has
+    spilled, new blocks keep going to the deque until the consumer empties it.
+
+    With ``publish_every > 1`` each slot collects that many blocks before it
+    is published, so the consumer sees one larger entry per batch.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        block_frames: int,
+        channels: int,
+        dtype: str,
+        publish_every: int = 1,
+    ):
+        self._publish_every = max(1, publish_every)
+        self._slot_frames = block_frames * self._publish_every
+        self._buffer = np.zeros((capacity, self._slot_frames, channels), dtype=dtype)
+        self._frames = np.zeros(capacity, dtype=np.int64)
+        self._capacity = capacity
+        self._head = 0
+        self._tail = 0
+        # Producer-only fill state of the slot at _head
+        self._fill = 0
+        self._fill_blocks = 0
+        # Blocks that did not fit in the ring, newer than everything in it.
+        # deque append/popleft are atomic under the GIL.
+        self._spill: collections.deque = collections.deque()
+        self.overruns = 0
+
+    def __len__(self) -> int:
+        return self._head - self._tail + len(self._spill)
+
+    def push(self, block: np.ndarray) -> bool:
+        """Copy a block into the slot being filled (producer side).
+
+        Returns False if the block went to the overflow store instead.
+        """
+        head = self._head
+        frames = block.shape[0]
+        if self._spill or head - self._tail >= self._capacity or frames > self._slot_frames:
+            # Keep order: anything already batched is published first
+            self.flush()
+            self._spill.append(block.copy())
+            self.overruns += 1
+            return False
+
+        slot = head % self._capacity
+        offset = self._fill
+        if offset + frames > self._slot_frames:
+            # Variable-size blocks overflowed the batch; publish what we have
+            self.flush()
+            return self.push(block)
+
+        np.copyto(self._buffer[slot, offset : offset + frames], block)
+        self._fill = offset + frames
+        self._fill_blocks += 1
+        if self._fill_blocks >= self._publish_every:
+            self.flush()
+        return True
+
+    def flush(self) -> None:
+        """Publish a partially filled batch (producer side)."""
+        if self._fill == 0:
+            return
+        head = self._head
+        self._frames[head % self._capacity] = self._fill
+        self._fill = 0
+        self._fill_blocks = 0
+        self._head = head + 1
+
+    def pop(self) -> Optional[np.ndarray]:
+        """Return a copy of the oldest block, or None if empty (consumer side)."""
+        tail = self._tail
+        if tail == self._head:
+            # The ring is empty, so any spilled blocks are the oldest left
+            try:
+                return self._spill.popleft()
+            except IndexError:
+                return None
+
+        slot = tail % self._capacity
+        data = self._buffer[slot, : self._frames[slot]].copy()
+        self._tail = tail + 1
+        return data
+
+    def drain(self) -> list[np.ndarray]:
+        """Copy out every published block at once and release them (consumer side).
+
+        The head is read once, the occupied slots are gathered with a single
+        fancy-index copy, and the tail is published once.
+        """
+        tail = self._tail
+        head = self._head
+        out: list[np.ndarray] = []
+        if tail != head:
+            slots = np.arange(tail, head) % self._capacity
+            blocks = self._buffer[slots]
+            frames = self._frames[slots]
+            self._tail = head
+            out = [blocks[i, : frames[i]] for i in range(len(slots))]
+
+        spill = self._spill
+        while spill:
+            out.append(spill.popleft())
+        return out
+
+    def clear(self) -> None:
+        """Discard everything published so far (consumer side)."""
+        self._tail = self._head
+        self._spill.clear()
+
+
 class AudioCapture:
     """Captures audio from system audio devices."""
 
@@ -40,50 +231,108 @@ class AudioCapture:
         self.config = config or CaptureConfig()
         self._state = CaptureState()
         self._stream: Optional[sd.InputStream] = None
-        self._audio_queue: queue.Queue = queue.Queue()
-        self._callbacks: list[Callable[[np.ndarray], None]] = []
+        self._ring: Optional[SPSCRingBuffer] = None
+        # Frame counter written by the audio thread; mirrored into
+        # CaptureState.samples_captured when the state is read.
+        self._samples_captured = (ctypes.c_uint64 * 1)()
+        # Wakes a blocked get_audio_data(); only set while a consumer waits,
+        # so the audio thread normally never touches the Event's lock.
+        self._data_ready = threading.Event()
+        self._consumer_waiting = False
+        self._pool: Optional[np.ndarray] = None
+        self._pool_idx = 0
+        # Copy-on-write: writers swap in a new tuple under _lock, the audio
+        # thread reads whatever tuple is current without locking.
+        self._callbacks: tuple[Callable[[np.ndarray], None], ...] = ()
         self._lock = threading.Lock()
+        # Callback exceptions are stored by the audio thread into fixed slots
+        # and only formatted later by drain_errors() on the caller's thread.
+        self._errors: list[Optional[Exception]] = [None] * _ERROR_SLOTS
+        self._err_count = 0
+        self._err_drained = 0
+        # One-shot priority boost, performed from inside the first callback
+        self._boost_pending = False
+        self._priority_error: Optional[str] = None
 
     @property
     def state(self) -> CaptureState:
         """Get current capture state."""
+        self._state.samples_captured = self._samples_captured[0]
+        self._state.overflow_blocks = self.overflow_blocks
         return self._state
 
+    @property
+    def samples_captured(self) -> int:
+        """Number of frames captured since start()."""
+        return int(self._samples_captured[0])
+
     @property
     def is_capturing(self) -> bool:
         """Check if capture is active."""
         return self._state.is_capturing
 
     def add_callback(self, callback: Callable[[np.ndarray], None]) -> None:
-        """Add a callback to receive audio data."""
+        """Add a callback to receive audio data.
+
+        By default each block is a fresh array the callback may keep. With
+        ``CaptureConfig.pool_blocks > 0`` the array comes from a reusable pool
+        and is overwritten ``pool_blocks`` blocks later; copy it if you keep it.
+        """
         with self._lock:
-            self._callbacks.append(callback)
+            self._callbacks = (*self._callbacks, callback)
 
     def remove_callback(self, callback: Callable[[np.ndarray], None]) -> None:
         """Remove a callback."""
         with self._lock:
-            if callback in self._callbacks:
-                self._callbacks.remove(callback)
+            callbacks = list(self._callbacks)
+            if callback in callbacks:
+                callbacks.remove(callback)
+                self._callbacks = tuple(callbacks)
 
     def _audio_callback(
         self, indata: np.ndarray, frames: int, time_info: dict, status: sd.CallbackFlags
     ) -> None:
         """Internal callback for sounddevice stream."""
+        if self._boost_pending:
+            self._boost_pending = False
+            try:
+                _raise_current_thread_priority()
+            except Exception as e:
+                self._priority_error = str(e)
+
         if status:
             self._state.error = str(status)
 
-        # Copy data to avoid issues with buffer reuse
-        data = indata.copy()
-        self._audio_queue.put(data)
-        self._state.samples_captured += frames
+        ring = self._ring
+        if ring is not None:
+            ring.push(indata)
+            if self._consumer_waiting and len(ring):
+                self._data_ready.set()
+
+        self._samples_captured[0] += frames
+
+        # Skip the copy entirely when no one is listening
+        callbacks = self._callbacks
+        if not callbacks or not self.config.enable_callbacks:
+            return
+
+        # indata itself is reused by PortAudio; copy into the next pool slot
+        # when pooling is enabled, otherwise into a fresh array
+        pool = self._pool
+        if pool is not None and frames <= pool.shape[1]:
+            data = pool[self._pool_idx % pool.shape[0], :frames]
+            self._pool_idx += 1
+            np.copyto(data, indata)
+        else:
+            data = indata.copy()
 
         # Notify external callbacks
-        with self._lock:
-            for callback in self._callbacks:
-                try:
-                    callback(data)
-                except Exception as e:
-                    print(f"Callback error: {e}")
+        for callback in callbacks:
+            try:
+                callback(data)
+            except Exception as e:
+                self._errors[self._err_count % _ERROR_SLOTS] = e
+                self._err_count += 1
 
     def _resolve_device(self) -> Optional[AudioDevice]:
         """Resolve the capture device to use."""
@@ -101,6 +350,21 @@ class AudioCapture:
         print("Warning: No loopback device found. Falling back to default input.")
         return None
 
+    def _stream_params(self, device_idx: Optional[int]) -> tuple[Union[str, float], int]:
+        """Resolve latency to seconds (and optionally blocksize) for a device.
+
+        PortAudio would otherwise look up "low"/"high" on every open.
+        """
+        latency = self.config.latency
+        blocksize = self.config.blocksize
+        if isinstance(latency, str) and device_idx is not None:
+            seconds = _device_latency(device_idx, latency)
+            if seconds:
+                latency = seconds
+        if self.config.auto_blocksize and not isinstance(latency, str):
+            blocksize = max(1, int(latency * self.config.sample_rate))
+        return latency, blocksize
+
     def start(self) -> bool:
         """Start capturing audio."""
         if self._state.is_capturing:
@@ -116,20 +380,42 @@ class AudioCapture:
             device_idx = None
             print("Capturing from default input device")
 
+        latency, blocksize = self._stream_params(device_idx)
+        block_frames = blocksize or _VARIABLE_BLOCK_FRAMES
+        self._ring = None
+        if self.config.enable_queue:
+            publish_every = max(1, self.config.publish_every)
+            self._ring = SPSCRingBuffer(
+                math.ceil(self.config.queue_blocks / publish_every),
+                block_frames,
+                self.config.channels,
+                self.config.dtype,
+                publish_every=publish_every,
+            )
+        self._pool = None
+        if self.config.enable_callbacks and self.config.pool_blocks > 0:
+            self._pool = np.empty(
+                (self.config.pool_blocks, block_frames, self.config.channels),
+                dtype=self.config.dtype,
+            )
+        self._pool_idx = 0
+        self._samples_captured[0] = 0
+        self._priority_error = None
+        self._boost_pending = self.config.realtime_priority
+
         try:
             self._stream = sd.InputStream(
                 device=device_idx,
                 samplerate=self.config.sample_rate,
                 channels=self.config.channels,
                 dtype=self.config.dtype,
-                blocksize=self.config.blocksize,
-                latency=self.config.latency,
+                blocksize=blocksize,
+                latency=latency,
                 callback=self._audio_callback,
             )
             self._stream.start()
             self._state.is_capturing = True
             self._state.error = None
-            self._state.samples_captured = 0
             return True
 
         except Exception as e:
@@ -144,32 +430,95 @@ class AudioCapture:
             self._stream.close()
             self._stream = None
 
+        # The producer has stopped; hand over any partially filled batch
+        if self._ring is not None:
+            self._ring.flush()
+
         self._state.is_capturing = False
 
+        overflow = self.overflow_blocks
+        if overflow:
+            print(
+                f"Note: {overflow} audio blocks overflowed the preallocated queue "
+                f"(queue_blocks={self.config.queue_blocks}); raise queue_blocks to avoid "
+                "allocating on the audio thread"
+            )
+
+        for message in self.drain_errors():
+            print(message)
+
+    @property
+    def priority_error(self) -> Optional[str]:
+        """Why raising the audio thread priority failed, if it did."""
+        return self._priority_error
+
+    @property
+    def callback_errors(self) -> int:
+        """Total number of exceptions raised by callbacks."""
+        return self._err_count
+
+    def drain_errors(self) -> list[str]:
+        """Return messages for callback errors raised since the last drain.
+
+        Only the most recent errors are kept; older ones are still counted
+        in ``callback_errors``.
+        """
+        end = self._err_count
+        start = max(self._err_drained, end - _ERROR_SLOTS)
+        self._err_drained = end
+        return [f"Callback error: {self._errors[i % _ERROR_SLOTS]}" for i in range(start, end)]
+
+    @property
+    def overflow_blocks(self) -> int:
+        """Number of blocks that spilled past the preallocated ring buffer."""
+        return self._ring.overruns if self._ring is not None else 0
+
     def get_audio_data(self, timeout: Optional[float] = None) -> Optional[np.ndarray]:
-        """Get the next block of audio data from the queue."""
-        try:
-            return self._audio_queue.get(timeout=timeout)
-        except queue.Empty:
+        """Get the next block of audio data from the queue.
+
+        Blocks until data arrives, or for at most ``timeout`` seconds. The
+        first ``queue_blocks`` unread blocks live in a preallocated ring; if it
+        is not read fast enough, later blocks spill into a growable store, so
+        nothing is dropped (see ``overflow_blocks``).
+        """
+        ring = self._ring
+        if ring is None:
             return None
 
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            data = ring.pop()
+            if data is not None:
+                return data
+
+            self._data_ready.clear()
+            self._consumer_waiting = True
+            try:
+                # Re-check after announcing ourselves so a block pushed in
+                # between is not missed
+                data = ring.pop()
+                if data is not None:
+                    return data
+                if deadline is None:
+                    self._data_ready.wait()
+                else:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0 or not self._data_ready.wait(remaining):
+                        return ring.pop()
+            finally:
+                self._consumer_waiting = False
+
     def clear_queue(self) -> None:
         """Clear any buffered audio data."""
-        while not self._audio_queue.empty():
-            try:
-                self._audio_queue.get_nowait()
-            except queue.Empty:
-                break
+        if self._ring is not None:
+            self._ring.clear()
 
     def get_all_queued_data(self) -> list[np.ndarray]:
         """Get all queued audio data."""
-        data = []
-        while not self._audio_queue.empty():
-            try:
-                data.append(self._audio_queue.get_nowait())
-            except queue.Empty:
-                break
-        return data
+        ring = self._ring
+        if ring is None:
+            return []
+        return ring.drain()
 
     def __enter__(self) -> "AudioCapture":
         """Context manager entry."""
@@ -202,22 +551,27 @@ def capture_audio_sync(
         device=device,
         sample_rate=sample_rate,
         channels=channels,
+        enable_queue=False,
+        pool_blocks=8,  # collect_callback copies each block out immediately
     )
 
     capture = AudioCapture(config)
-    audio_chunks = []
+
+    # Write straight into a pre-sized buffer instead of collecting blocks
+    total = int(math.ceil(duration * sample_rate))
+    out = np.empty((total, channels), dtype=np.float32)
+    offset = 0
 
     def collect_callback(data: np.ndarray) -> None:
-        audio_chunks.append(data)
+        nonlocal offset
+        n = min(len(data), total - offset)
+        out[offset : offset + n] = data[:n]
+        offset += n
 
     capture.add_callback(collect_callback)
 
     with capture:
         # Wait for the specified duration
-        import time
-
         time.sleep(duration)
 
-    if audio_chunks:
-        return np.concatenate(audio_chunks, axis=0)
-    return np.array([], dtype=np.float32)
+    return out[:offset]
@@ -4,25 +4,203 @@
 """
 
 import logging
+import math
+import os
+import queue
+import struct
 import threading
 import time
-import wave
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import date, datetime
 from pathlib import Path
 from typing import Callable, Optional
 
 import numpy as np
 import sounddevice as sd
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+try:
+    import webrtcvad
+except ImportError:
+    webrtcvad = None
+
 from .config import VoiceLinkConfig, get_config
 from .session import AudioChunk, Session, SessionManager
-from .vad import VADConfig, extract_voice_segments
 
 logger = logging.getLogger(__name__)
 
+# 링 버퍼 크기 (청크 길이의 배수)
+RING_BUFFER_CHUNKS = 4
+
+# 음성 비율 계산용 VAD 프레임 길이 (ms)
+VAD_FRAME_MS = 30
+
+# 음성 프레임으로 볼 영교차율 범위 (샘플당). 험(hum)은 너무 낮고 백색 잡음은 너무 높음
+VAD_ZCR_MIN = 0.01
+VAD_ZCR_MAX = 0.4
+
+# 에너지+ZCR 판정 결과가 이 구간이면 webrtcvad로 다시 확인 (무음 판정 기준 5% 근처)
+VAD_REFINE_RANGE = (0.02, 0.15)
+
+# 디스크 쓰기 대기열에 쌓아둘 최대 청크 수
+WRITE_QUEUE_SIZE = 8
+
+# 진행 중인 세션 메타데이터를 디스크에 반영하는 최소 간격 (초)
+SESSION_SAVE_INTERVAL_SECONDS = 60
+
+# 입력 스트림 샘플 형식 (WAV 저장과 VAD 모두 int16을 그대로 사용)
+STREAM_DTYPE = "int16"
+
+
+def _rms_int16_numpy(x: np.ndarray) -> float:
+    """int16 오디오의 RMS를 [-1, 1] 스케일로 계산 (NumPy 버전)."""
+    flat = x.ravel().astype(np.float32)
+    if flat.size == 0:
+        return 0.0
+    return math.sqrt(float(np.dot(flat, flat)) / flat.size) / 32768.0
 
-@dataclass
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _rms_int16(x):
+        """int16 오디오의 RMS를 임시 배열 없이 한 번의 루프로 계산 (Numba 버전)."""
+        flat = x.ravel()
+        if flat.size == 0:
+            return 0.0
+        sum_sq = 0
+        for i in range(flat.size):
+            v = np.int64(flat[i])
+            sum_sq += v * v
+        return math.sqrt(sum_sq / flat.size) / 32768.0
+else:
+    _rms_int16 = _rms_int16_numpy
+
+
+def _analyze_i16_numpy(
+    x: np.ndarray,
+    frame_len: int,
+    e_thresh: float,
+    zcr_lo: float,
+    zcr_hi: float,
+    voiced: np.ndarray,
+) -> tuple[float, float]:
+    """RMS와 에너지+영교차율 기반 음성 프레임 비율을 계산 (NumPy 버전).
+
+    voiced에는 프레임별 판정 결과를 기록합니다. 반환값은 (RMS, 음성 비율)이며
+    RMS는 [-1, 1] 스케일입니다.
+    """
+    rms = _rms_int16_numpy(x)
+    n_frames = len(voiced)
+    if n_frames == 0 or frame_len < 2:
+        # 샘플이 1개뿐인 프레임은 영교차율을 정의할 수 없으므로 음성 없음으로 처리
+        voiced[:] = False
+        return rms, 0.0
+    frames = x[:n_frames * frame_len].reshape(n_frames, frame_len)
+    # 프레임별 제곱합을 제곱 임시 배열 없이 einsum 한 번으로 계산
+    frames_f32 = frames.astype(np.float32)
+    energy = np.einsum("ij,ij->i", frames_f32, frames_f32) / frame_len
+    signs = frames >= 0
+    zcr = np.count_nonzero(signs[:, 1:] != signs[:, :-1], axis=1) / (frame_len - 1)
+    voiced[:] = (energy > e_thresh) & (zcr >= zcr_lo) & (zcr <= zcr_hi)
+    return rms, float(voiced.mean())
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _analyze_i16(x, frame_len, e_thresh, zcr_lo, zcr_hi, voiced):
+        """RMS와 프레임별 에너지+영교차율 판정을 한 번의 패스로 계산 (Numba 버전)."""
+        if x.shape[0] == 0:
+            voiced[:] = False
+            return 0.0, 0.0
+        n_frames = voiced.shape[0]
+        if frame_len < 2:
+            # 샘플이 1개뿐인 프레임은 영교차율을 정의할 수 없으므로 음성 없음으로 처리
+            voiced[:] = False
+            n_frames = 0
+        n_voiced = 0
+        total = 0
+        for f in range(n_frames):
+            start = f * frame_len
+            energy = 0
+            crossings = 0
+            prev_pos = x[start] >= 0
+            for i in range(start, start + frame_len):
+                v = np.int64(x[i])
+                energy += v * v
+                pos = v >= 0
+                if pos != prev_pos:
+                    crossings += 1
+                prev_pos = pos
+            total += energy
+            zcr = crossings / (frame_len - 1)
+            is_voiced = energy / frame_len > e_thresh and zcr_lo <= zcr <= zcr_hi
+            voiced[f] = is_voiced
+            if is_voiced:
+                n_voiced += 1
+        # 프레임에 못 들어간 끝부분도 RMS에는 포함
+        for i in range(n_frames * frame_len, x.shape[0]):
+            v = np.int64(x[i])
+            total += v * v
+        rms = math.sqrt(total / x.shape[0]) / 32768.0
+        ratio = n_voiced / n_frames if n_frames > 0 else 0.0
+        return rms, ratio
+else:
+    _analyze_i16 = _analyze_i16_numpy
+
+
+# 44바이트 PCM WAV 헤더 (RIFF + fmt + data)
+_WAV_HEADER = struct.Struct("<4sI4s4sIHHIIHH4sI")
+
+
+def _write_wav(
+    file_path: Path,
+    audio_int16: np.ndarray,
+    sample_rate: int,
+    channels: int,
+    header: Optional[bytearray] = None,
+) -> None:
+    """16비트 PCM WAV 파일을 씁니다.
+
+    44바이트 헤더를 직접 만들고 PCM 데이터는 memoryview로 복사 없이 씁니다.
+    os.writev가 있으면(Linux/macOS) 헤더와 데이터를 한 번의 시스템 콜로 씁니다.
+    header에 재사용할 버퍼를 넘기면 헤더를 그 자리에 채웁니다.
+    """
+    pcm = memoryview(np.ascontiguousarray(audio_int16)).cast("B")
+    if header is None:
+        header = bytearray(_WAV_HEADER.size)
+    _WAV_HEADER.pack_into(
+        header, 0,
+        b"RIFF", 36 + pcm.nbytes, b"WAVE",
+        b"fmt ", 16, 1, channels, sample_rate,
+        sample_rate * channels * 2, channels * 2, 16,
+        b"data", pcm.nbytes,
+    )
+    if not hasattr(os, "writev"):
+        # Windows: 버퍼링된 쓰기로 대체
+        with open(file_path, "wb", buffering=1 << 20) as f:
+            f.write(header)
+            f.write(pcm)
+        return
+
+    fd = os.open(str(file_path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        views = [memoryview(header), pcm]
+        while views:
+            written = os.writev(fd, views)
+            # 일부만 쓰였으면 남은 부분부터 다시 씀
+            while views and written >= len(views[0]):
+                written -= len(views.pop(0))
+            if views:
+                views[0] = views[0][written:]
+    finally:
+        os.close(fd)
+
+
+@dataclass(slots=True)
 class ChunkedRecorderState:
     """청크 레코더 상태."""
     is_recording: bool = False
@@ -32,7 +210,7 @@ class ChunkedRecorderState:
     last_chunk_time: Optional[datetime] = None
     consecutive_silence_count: int = 0
     current_instant_rms: float = 0.0
-    last_sound_time: float = 0.0
+    last_sound_time: float = 0.0  # time.monotonic() 기준, 0이면 아직 소리 없음
 
 
 class ChunkedRecorder:
@@ -42,6 +220,11 @@ class ChunkedRecorder:
     무음 간격을 감지하여 세션을 자동으로 분리합니다.
     """
 
+    # 장치 스캔 최소 간격 (5초, 나노초 단위)
+    DEVICE_SCAN_INTERVAL_NS = 5_000_000_000
+    # 대안 장치를 못 찾을 때마다 간격을 두 배로 늘리는 상한 (5분)
+    DEVICE_SCAN_MAX_INTERVAL_NS = 300_000_000_000
+
     def __init__(
         self,
         config: Optional[VoiceLinkConfig] = None,
@@ -54,33 +237,97 @@ class ChunkedRecorder:
         self.session_manager = SessionManager(self.config.storage.data_path)
 
         self._stream: Optional[sd.InputStream] = None
-        self._audio_buffer: list[np.ndarray] = []
-        self._buffer_lock = threading.Lock()
+        # 콜백이 쓰고 청크 처리 스레드가 읽는 링 버퍼 (start()에서 할당)
+        # _ring_w/_ring_r은 누적 프레임 위치이며, 실제 인덱스는 크기로 나눈 나머지.
+        # _ring_w는 콜백만, _ring_r은 처리 스레드만 쓰고 int 대입은 GIL 하에서
+        # 원자적이므로 락 없이 주고받음 (단일 생산자/단일 소비자)
+        self._ring: Optional[np.ndarray] = None
+        self._ring_w = 0
+        self._ring_r = 0
+        self._ring_overruns = 0
+        # 청크 분량이 모이면 콜백이 처리 스레드를 깨움. 처리 스레드가 대기 중일
+        # 때만 set하므로 콜백은 보통 Event의 락을 건드리지 않음
+        self._data_ready = threading.Event()
+        self._consumer_waiting = False
         self._chunk_thread: Optional[threading.Thread] = None
         self._monitor_thread: Optional[threading.Thread] = None
+        # 장치 스캔 요청 신호와 이를 처리하는 상주 스레드 (스캔은 한 번에 하나만)
+        self._scan_trigger = threading.Event()
+        self._scan_thread: Optional[threading.Thread] = None
+        # 주기적 스캔에서 장치별 프로브 스트림을 재사용하는 AudioProbePool
+        # (스캔 스레드가 처음 스캔할 때 생성, stop()에서 닫음)
+        self._probe_pool = None
+        # WAV 쓰기/삭제 작업 대기열: (경로, int16 데이터 또는 삭제 시 None)
+        self._write_queue: queue.Queue = queue.Queue(maxsize=WRITE_QUEUE_SIZE)
+        self._writer_thread: Optional[threading.Thread] = None
+        # 쓰기 스레드가 재사용하는 WAV 헤더 버퍼
+        self._hdr_buf = bytearray(_WAV_HEADER.size)
         self._stop_event = threading.Event()
 
-        self._on_chunk_saved: list[Callable[[AudioChunk], None]] = []
-        self._on_session_created: list[Callable[[Session], None]] = []
         self._on_chunk_saved: list[Callable[[AudioChunk], None]] = []
         self._on_session_created: list[Callable[[Session], None]] = []
         self._on_session_completed: list[Callable[[Session], None]] = []
         self._on_device_changed: list[Callable[[int, str], None]] = []
         
-        # 마지막 스캔 시간
-        self._last_device_scan_time = 0.0
+        # 마지막 스캔 시간 (time.monotonic_ns 기준, 정수 비교)
+        self._last_device_scan_time = 0
+        # 현재 스캔 간격 (무음이 계속되는 동안 대안 장치가 없으면 늘어남)
+        self._scan_interval_ns = self.DEVICE_SCAN_INTERVAL_NS
+
+        # webrtcvad 인스턴스 (처음 사용할 때 생성)
+        self._vad = None
+
+        # 다채널 청크의 분석용 모노 다운믹스 버퍼 (처리 스레드 전용)
+        self._mono_f32: Optional[np.ndarray] = None
+        self._mono_i16: Optional[np.ndarray] = None
+
+        # 아직 저장하지 않은 청크 수 (세션 저장 디바운스용)
+        self._unsaved_chunks = 0
+
+        # 오늘 날짜 폴더 캐시 (날짜가 바뀔 때만 갱신)
+        self._today: Optional[date] = None
+        self._today_dir: Optional[Path] = None
+
+        self._cache_config_values()
+
+    def _cache_config_values(self) -> None:
+        """핫 패스에서 쓰는 설정값을 미리 계산해 둡니다 (start()에서 갱신)."""
+        recording = self.config.recording
+        chunk_duration = recording.chunk_duration_seconds
+        self._sr = int(recording.sample_rate)
+        self._ch = int(recording.channels)
+        self._samples_per_chunk = int(chunk_duration * self._sr)
+        self._silence_thresh = float(recording.silence_threshold)
+        # 세션을 종료할 연속 무음 청크 수
+        self._silence_chunks_threshold = int(
+            self.config.session.silence_gap_seconds // chunk_duration
+        )
+        self._min_session_duration = float(self.config.session.min_session_duration)
+        # 장치 자동 전환 여부와 전환 스캔을 시작할 무음 시간(초)
+        self._auto_switch = bool(self.config.device.auto_switch)
+        self._switch_timeout = float(self.config.device.silence_timeout_for_switch)
+        # 다른 장치 스캔을 시도할 연속 무음 청크 수
+        self._switch_silence_chunks = math.ceil(self._switch_timeout / chunk_duration)
+        # 진행 중인 세션을 저장할 청크 간격
+        self._session_save_every = max(1, int(SESSION_SAVE_INTERVAL_SECONDS // chunk_duration))
 
     @property
     def data_dir(self) -> Path:
         """데이터 저장 디렉토리를 반환합니다."""
         return self.config.storage.data_path
 
-    def _get_today_dir(self) -> Path:
-        """오늘 날짜 폴더를 반환합니다."""
-        today = datetime.now().strftime("%Y-%m-%d")
-        today_dir = self.data_dir / today
-        today_dir.mkdir(parents=True, exist_ok=True)
-        return today_dir
+    def _get_today_dir(self, now: Optional[datetime] = None) -> Path:
+        """오늘 날짜 폴더를 반환합니다.
+
+        날짜가 바뀌었을 때만 폴더를 만들고, 그 외에는 캐시된 경로를 반환합니다.
+        """
+        today = (now or datetime.now()).date()
+        if today != self._today:
+            today_dir = self.data_dir / today.strftime("%Y-%m-%d")
+            today_dir.mkdir(parents=True, exist_ok=True)
+            self._today_dir = today_dir
+            self._today = today
+        return self._today_dir
 
     def _audio_callback(
         self,
@@ -94,52 +341,131 @@ class ChunkedRecorder:
             logger.warning(f"오디오 상태: {status}")
 
         # 실시간 RMS 계산 및 업데이트
-        rms = np.sqrt(np.mean(indata**2))
-        self.state.current_instant_rms = float(rms)
-        if rms > self.config.recording.silence_threshold:
-            self.state.last_sound_time = time.time()
-
-        with self._buffer_lock:
-            self._audio_buffer.append(indata.copy())
-
-    def _calculate_rms(self, audio_data: np.ndarray) -> float:
-        """RMS 레벨을 계산합니다."""
-        return float(np.sqrt(np.mean(audio_data ** 2)))
-
-    def _is_silent(self, audio_data: np.ndarray) -> bool:
-        """무음 여부를 판단합니다."""
-        rms = self._calculate_rms(audio_data)
-        rms = self._calculate_rms(audio_data)
-        return rms < self.config.recording.silence_threshold
-
-    def _calculate_speech_ratio(self, audio_int16: np.ndarray) -> float:
-        """오디오의 음성 구간 비율을 계산합니다."""
-        if len(audio_int16) == 0:
-            return 0.0
-        
+        state = self.state
+        rms = _rms_int16(indata)
+        state.current_instant_rms = rms
+        if rms > self._silence_thresh:
+            state.last_sound_time = time.monotonic()
+
+        ring = self._ring
+        size = len(ring)
+        n = len(indata)
+        w = self._ring_w
+        r = self._ring_r
+        # 처리 스레드가 밀려 버퍼가 가득 차면 새 블록을 버림
+        if w + n - r > size:
+            self._ring_overruns += 1
+            return
+        i = w % size
+        first = min(n, size - i)
+        ring[i:i + first] = indata[:first]
+        if first < n:
+            ring[:n - first] = indata[first:]
+        # 데이터를 다 쓴 뒤에 쓰기 위치를 공개
+        w += n
+        self._ring_w = w
+        if self._consumer_waiting and w - r >= self._samples_per_chunk:
+            self._data_ready.set()
+
+    def _peek_ring(self, frames: int) -> Optional[np.ndarray]:
+        """링 버퍼에서 frames 만큼의 데이터를 읽습니다 (읽기 위치는 유지).
+
+        경계를 넘지 않으면 복사 없이 뷰를 반환합니다. 데이터가 부족하면 None.
+        """
+        r = self._ring_r
+        if self._ring_w - r < frames:
+            return None
+        ring = self._ring
+        size = len(ring)
+        i = r % size
+        if i + frames <= size:
+            return ring[i:i + frames]
+        return np.concatenate((ring[i:], ring[:i + frames - size]), axis=0)
+
+    def _consume_ring(self, frames: int) -> None:
+        """읽기 위치를 frames 만큼 앞으로 옮겨 공간을 반환합니다."""
+        self._ring_r += frames
+
+    def _downmix(self, audio_int16: np.ndarray) -> np.ndarray:
+        """분석(RMS/VAD)용 모노 신호를 반환합니다.
+
+        WAV는 설정된 채널 수 그대로 저장하고, 다채널이면 분석용으로만 처리
+        스레드에서 미리 할당한 버퍼에 평균을 냅니다. 반환값은 다음 청크에서
+        덮어쓰이므로 이번 청크 분석에만 사용합니다.
+        """
+        if audio_int16.shape[1] == 1:
+            return audio_int16[:, 0]
+        n = len(audio_int16)
+        if self._mono_f32 is None or len(self._mono_f32) < n:
+            self._mono_f32 = np.empty(n, dtype=np.float32)
+            self._mono_i16 = np.empty(n, dtype=np.int16)
+        mono_f32 = self._mono_f32[:n]
+        mono_i16 = self._mono_i16[:n]
+        np.mean(audio_int16, axis=1, dtype=np.float32, out=mono_f32)
+        np.copyto(mono_i16, mono_f32, casting="unsafe")
+        return mono_i16
+
+    def _analyze_chunk(self, audio_int16: np.ndarray) -> tuple[float, float, np.ndarray]:
+        """청크의 RMS와 에너지+ZCR 음성 비율을 한 번의 패스로 계산합니다.
+
+        (RMS, 음성 프레임 비율, 프레임별 음성 판정 배열)을 반환합니다.
+        """
+        x = np.ascontiguousarray(audio_int16.ravel())
+        frame_samples = self._sr * VAD_FRAME_MS // 1000
+        n_frames = len(x) // frame_samples if frame_samples >= 2 else 0
+        voiced = np.empty(n_frames, dtype=np.bool_)
+        energy_thresh = (self._silence_thresh * 32767) ** 2
+        rms, ratio = _analyze_i16(
+            x, frame_samples, energy_thresh, VAD_ZCR_MIN, VAD_ZCR_MAX, voiced
+        )
+        return float(rms), float(ratio), voiced
+
+    def _calculate_speech_ratio(
+        self,
+        audio_int16: np.ndarray,
+        analysis: Optional[tuple[float, float, np.ndarray]] = None,
+    ) -> float:
+        """오디오의 음성 구간 비율을 계산합니다.
+
+        30ms 프레임별 에너지와 영교차율로 음성 프레임을 판정합니다.
+        결과가 무음 판정 기준 근처(VAD_REFINE_RANGE)일 때만 webrtcvad로
+        다시 확인합니다. _analyze_chunk() 결과가 있으면 analysis로 넘겨
+        버퍼를 다시 훑지 않도록 합니다.
+        """
         try:
-            # VAD 설정 (기본값)
-            config = VADConfig(
-                sample_rate=self.config.recording.sample_rate,
-                frame_duration_ms=30,
-                aggressiveness=3  # 보수적 판정 (확실한 음성만)
-            )
-            
-            # 음성 추출
-            segments = list(extract_voice_segments(
-                audio_int16.tobytes(),
-                sample_rate=config.sample_rate,
-                config=config
-            ))
-            
-            if not segments:
+            x = np.ascontiguousarray(audio_int16.ravel())
+            if analysis is None:
+                analysis = self._analyze_chunk(x)
+            _, ratio, voiced = analysis
+
+            n_frames = len(voiced)
+            if n_frames == 0:
                 return 0.0
-                
-            total_voice_samples = sum(len(seg) for seg in segments) / 2  # 2 bytes per sample
-            total_samples = len(audio_int16)
-            
-            return total_voice_samples / total_samples
-            
+
+            sample_rate = self._sr
+            lo, hi = VAD_REFINE_RANGE
+            if (
+                webrtcvad is None
+                or sample_rate not in (8000, 16000, 32000, 48000)
+                or not lo <= ratio <= hi
+            ):
+                return ratio
+
+            if self._vad is None:
+                self._vad = webrtcvad.Vad(3)  # 보수적 판정 (확실한 음성만)
+
+            # int16 버퍼를 bytes로 복사하지 않고 memoryview를 오프셋으로 잘라 씀
+            pcm = memoryview(x).cast("B")
+            frame_bytes = (sample_rate * VAD_FRAME_MS // 1000) * 2
+            is_speech = self._vad.is_speech
+            n_voiced = 0
+            for i in np.flatnonzero(voiced):
+                offset = int(i) * frame_bytes
+                if is_speech(pcm[offset:offset + frame_bytes], sample_rate):
+                    n_voiced += 1
+
+            return n_voiced / n_frames
+
         except Exception as e:
             # logger.warning(f"VAD 계산 오류: {e}")
             return 0.0
@@ -150,7 +476,7 @@ class ChunkedRecorder:
             return None
 
         now = datetime.now()
-        today_dir = self._get_today_dir()
+        today_dir = self._get_today_dir(now)
 
         # 파일명 생성
         time_str = now.strftime("%H-%M-%S")
@@ -159,43 +485,42 @@ class ChunkedRecorder:
         file_path = today_dir / filename
         relative_path = f"{today_dir.name}/{filename}"
 
-        # int16 변환 (저장 및 VAD용)
+        # 스트림이 int16이므로 변환 없이 저장하고, 분석은 모노 다운믹스로 수행
+        audio_int16 = audio_data
+
+        # RMS와 에너지+ZCR 음성 판정을 한 번의 패스로 계산
         try:
-            if audio_data.dtype == np.float32:
-                # 클리핑 방지
-                audio_clipped = np.clip(audio_data, -1.0, 1.0)
-                audio_int16 = (audio_clipped * 32767).astype(np.int16)
-            else:
-                audio_int16 = audio_data.astype(np.int16)
+            mono = self._downmix(audio_int16)
+            analysis = self._analyze_chunk(mono)
         except Exception as e:
-            logger.error(f"오디오 변환 실패: {e}")
+            logger.error(f"오디오 분석 실패: {e}")
             return None
-
-        # RMS 계산
-        rms = self._calculate_rms(audio_data)
+        rms = analysis[0]
 
         # [VAD] 음성 비율 계산
-        speech_ratio = self._calculate_speech_ratio(audio_int16)
+        # RMS가 임계값 미만이면 VAD 결과와 무관하게 무음이므로 VAD 생략
+        if rms < self._silence_thresh:
+            speech_ratio = 0.0
+        else:
+            speech_ratio = self._calculate_speech_ratio(mono, analysis)
         
         # [스마트 무음 판정]
         # 1. RMS가 임계값 미만 (너무 조용함)
         # 2. RMS는 높지만 사람 목소리 비율이 5% 미만 (잡음/소음)
-        is_silent = (rms < self.config.recording.silence_threshold) or (speech_ratio < 0.05)
+        is_silent = (rms < self._silence_thresh) or (speech_ratio < 0.05)
 
-        # WAV 파일 저장
+        # WAV 파일 저장은 쓰기 스레드에 맡김 (링 버퍼 영역은 곧 재사용되므로 복사)
         try:
-            with wave.open(str(file_path), "wb") as wf:
-                wf.setnchannels(self.config.recording.channels)
-                wf.setsampwidth(2)  # 16-bit
-                wf.setframerate(self.config.recording.sample_rate)
-                wf.writeframes(audio_int16.tobytes())
-
-        except Exception as e:
-            logger.error(f"청크 저장 실패: {e}")
-            return None
+            self._write_queue.put_nowait((file_path, audio_int16.copy()))
+        except queue.Full:
+            # 쓰기 스레드가 밀려 대기열이 가득 차면 이 스레드에서 직접 저장
+            try:
+                _write_wav(file_path, audio_int16, self._sr, self._ch)
+            except Exception as e:
+                logger.error(f"청크 저장 실패: {e}")
 
         # 청크 객체 생성
-        duration = len(audio_data) / self.config.recording.sample_rate
+        duration = len(audio_data) / self._sr
         chunk = AudioChunk(
             file_path=relative_path,
             timestamp=now,
@@ -223,40 +548,42 @@ class ChunkedRecorder:
 
     def _handle_session(self, chunk: AudioChunk) -> None:
         """세션 관리를 처리합니다."""
-        silence_gap = self.config.session.silence_gap_seconds
-        chunk_duration = self.config.recording.chunk_duration_seconds
-
         # 연속 무음 청크 카운트
         if chunk.is_silent:
             self.state.consecutive_silence_count += 1
         else:
             self.state.consecutive_silence_count = 0
 
-        # 무음 간격으로 세션 분리
-        silence_chunks_threshold = silence_gap // chunk_duration
-
         # 현재 세션이 없으면 새 세션 시작
         if self.state.current_session is None:
             if not chunk.is_silent:
                 self._start_new_session(chunk)
             return
 
-        # 세션에 청크 추가
+        # 세션에 청크 추가 (저장은 일정 청크마다 모아서)
         self.state.current_session.add_chunk(chunk)
-        self.session_manager.save_session(self.state.current_session)
+        self._unsaved_chunks += 1
+        if self._unsaved_chunks >= self._session_save_every:
+            self._flush_session()
 
-        # 충분한 무음이면 세션 종료
-        if self.state.consecutive_silence_count >= silence_chunks_threshold:
+        # 충분한 무음이면 세션 종료 (무음 간격으로 세션 분리)
+        if self.state.consecutive_silence_count >= self._silence_chunks_threshold:
             self._complete_current_session()
             
         # 연속 무음 시간이 길어지면 다른 장치 스캔 (Smart Silence Monitoring)
         if (
-            self.config.device.auto_switch 
+            self._auto_switch
             and chunk.is_silent 
-            and self.state.consecutive_silence_count >= (self.config.device.silence_timeout_for_switch / chunk_duration)
+            and self.state.consecutive_silence_count >= self._switch_silence_chunks
         ):
             self._check_alternative_devices()
 
+    def _flush_session(self) -> None:
+        """저장하지 않은 변경이 있으면 현재 세션을 저장합니다."""
+        if self.state.current_session is not None and self._unsaved_chunks:
+            self.session_manager.save_session(self.state.current_session)
+        self._unsaved_chunks = 0
+
     def _start_new_session(self, first_chunk: AudioChunk) -> None:
         """새 세션을 시작합니다."""
         session = Session.create_new(first_chunk.timestamp)
@@ -264,6 +591,7 @@ class ChunkedRecorder:
 
         self.state.current_session = session
         self.session_manager.save_session(session)
+        self._unsaved_chunks = 0
 
         logger.info(f"새 세션 시작: {session.session_id}")
         
@@ -272,19 +600,9 @@ class ChunkedRecorder:
              logger.info(f"세션 취소 (초기 음성 미검출): {first_chunk.speech_ratio*100:.1f}%")
              
              # [버그 수정] 세션을 시작하지 않으므로 파일도 삭제해야 함
-             try:
-                 # chunk.file_path는 relative path일 수 있으므로 주의 (절대 경로로 변환 필요)
-                 # _save_chunk에서 relative_path를 저장했으므로, data_dir와 합쳐야 함
-                 full_path = self.config.storage.log_dir.parent / "recordings" / first_chunk.file_path
-                 if not full_path.exists():
-                     # 혹시 경로가 안 맞을 경우를 대비해 config.storage.data_dir 사용
-                     full_path = Path(self.config.storage.data_dir) / first_chunk.file_path
-                 
-                 if full_path.exists():
-                     full_path.unlink()
-                     logger.debug(f"무음 파일 삭제됨: {full_path.name}")
-             except Exception as e:
-                 logger.error(f"무음 파일 삭제 실패: {e}")
+             # chunk.file_path는 data_dir 기준 상대 경로이며, 아직 쓰기 대기 중일 수
+             # 있으므로 같은 쓰기 스레드에 삭제를 맡겨 순서를 보장
+             self._write_queue.put((self.data_dir / first_chunk.file_path, None))
 
              self._complete_current_session() 
              return
@@ -303,7 +621,7 @@ class ChunkedRecorder:
         session = self.state.current_session
 
         # 최소 세션 길이 체크
-        if session.duration_seconds < self.config.session.min_session_duration:
+        if session.duration_seconds < self._min_session_duration:
             logger.debug(f"세션 무시 (너무 짧음): {session.duration_seconds:.1f}초")
             self.session_manager.delete_session(session.session_id)
         else:
@@ -319,6 +637,7 @@ class ChunkedRecorder:
 
         self.state.current_session = None
         self.state.consecutive_silence_count = 0
+        self._unsaved_chunks = 0
 
     def _chunk_processing_loop(self) -> None:
         """오디오 데이터를 청크로 처리하는 루프."""
@@ -326,6 +645,27 @@ class ChunkedRecorder:
         
         # ... (기존 코드)
 
+    def _writer_loop(self) -> None:
+        """청크 WAV 파일을 디스크에 쓰는 루프 (별도 스레드에서 실행)."""
+        while True:
+            item = self._write_queue.get()
+            if item is None:
+                break
+
+            file_path, audio_int16 = item
+            if audio_int16 is None:
+                try:
+                    file_path.unlink(missing_ok=True)
+                    logger.debug(f"무음 파일 삭제됨: {file_path.name}")
+                except Exception as e:
+                    logger.error(f"무음 파일 삭제 실패: {e}")
+                continue
+
+            try:
+                _write_wav(file_path, audio_int16, self._sr, self._ch, self._hdr_buf)
+            except Exception as e:
+                logger.error(f"청크 저장 실패: {e}")
+
     def _monitor_silence_loop(self) -> None:
         """백그라운드에서 실시간 침묵을 감시합니다."""
         logger.info("실시간 침묵 감시 스레드 시작")
@@ -337,48 +677,53 @@ class ChunkedRecorder:
                 continue
                 
             # 무음 지속 시간 계산
-            elapsed = time.time() - self.state.last_sound_time
-            timeout = self.config.device.silence_timeout_for_switch
+            elapsed = time.monotonic() - self.state.last_sound_time
+            timeout = self._switch_timeout
+            
+            # 소리가 다시 들어오면 스캔 간격을 초기값으로 되돌림
+            if elapsed <= timeout:
+                self._scan_interval_ns = self.DEVICE_SCAN_INTERVAL_NS
+                continue
             
-            # 타임아웃 초과 & 자동 전환 켜져있으면 스캔 시도
-            if elapsed > timeout and self.config.device.auto_switch:
-                # 마지막 스캔 후 5초 지났는지 체크 (중복 실행 방지)
-                if time.time() - self._last_device_scan_time > 5.0:
+            # 타임아웃 초과 & 자동 전환 켜져있으면 스캔 요청 (최소 간격은 내부에서 확인)
+            if self._auto_switch:
+                if self._check_alternative_devices():
                     logger.debug(f"실시간 무음 감지 ({elapsed:.1f}초) -> 장치 스캔 트리거")
-                    # 메인 스레드 부하 줄이기 위해 비동기로 실행
-                    threading.Thread(target=self._check_alternative_devices, daemon=True).start()
-                    # 중복 실행 방지를 위해 last_sound_time을 조금 미룸
-                    self.state.last_sound_time = time.time() - (timeout / 2)
 
+    def _scan_worker_loop(self) -> None:
+        """장치 스캔 요청을 처리하는 루프 (별도 스레드에서 실행)."""
+        while not self._stop_event.is_set():
+            if not self._scan_trigger.wait(timeout=1.0):
+                continue
+            self._scan_trigger.clear()
+            if self._stop_event.is_set():
+                break
+            self._scan_and_switch()
 
     def _chunk_processing_loop(self) -> None:
         """청크 처리 루프 (별도 스레드에서 실행)."""
-        chunk_duration = self.config.recording.chunk_duration_seconds
-        samples_per_chunk = chunk_duration * self.config.recording.sample_rate
+        samples_per_chunk = self._samples_per_chunk
 
         while not self._stop_event.is_set():
-            time.sleep(0.1)  # 100ms마다 체크
-
-            with self._buffer_lock:
-                if not self._audio_buffer:
-                    continue
-
-                # 버퍼 데이터 합치기
-                buffer_data = np.concatenate(self._audio_buffer, axis=0)
-
-                # 청크 크기에 도달했는지 확인
-                if len(buffer_data) < samples_per_chunk:
-                    continue
-
-                # 청크 추출
-                chunk_data = buffer_data[:int(samples_per_chunk)]
-                remaining = buffer_data[int(samples_per_chunk):]
-
-                # 버퍼 갱신
-                self._audio_buffer = [remaining] if len(remaining) > 0 else []
+            if self._ring_w - self._ring_r < samples_per_chunk:
+                self._data_ready.clear()
+                self._consumer_waiting = True
+                try:
+                    # 대기 표시 후 다시 확인해 그 사이 채워진 데이터를 놓치지 않음.
+                    # 콜백이 깨워줄 때까지 대기 (종료 확인을 위해 타임아웃 유지)
+                    if self._ring_w - self._ring_r < samples_per_chunk:
+                        self._data_ready.wait(timeout=1.0)
+                finally:
+                    self._consumer_waiting = False
+
+            # 청크 크기에 도달했는지 확인
+            chunk_data = self._peek_ring(samples_per_chunk)
+            if chunk_data is None:
+                continue
 
-            # 청크 저장 및 세션 처리
+            # 청크 저장 후 링 버퍼 공간 반환 (저장 중에는 덮어쓰이지 않음)
             chunk = self._save_chunk(chunk_data)
+            self._consume_ring(samples_per_chunk)
             if chunk:
                 self._handle_session(chunk)
 
@@ -411,13 +756,30 @@ class ChunkedRecorder:
                 device_idx = device.index
                 logger.info(f"자동 선택된 장치: [{device_idx}] {device.name}")
 
+        # 설정값 캐시 갱신 후 링 버퍼 할당 (설정된 채널 수 그대로 저장)
+        self._cache_config_values()
+        self._scan_interval_ns = self.DEVICE_SCAN_INTERVAL_NS
+        samples_per_chunk = self._samples_per_chunk
+        self._ring = np.empty(
+            (samples_per_chunk * RING_BUFFER_CHUNKS, self._ch), dtype=STREAM_DTYPE
+        )
+        self._ring_w = self._ring_r = 0
+        self._ring_overruns = 0
+
+        # 첫 콜백에서 JIT 컴파일 지연이 생기지 않도록 미리 컴파일
+        _rms_int16(np.zeros((1, 1), dtype=np.int16))
+        _analyze_i16(
+            np.zeros(2, dtype=np.int16), 2, 1.0, VAD_ZCR_MIN, VAD_ZCR_MAX,
+            np.empty(1, dtype=np.bool_),
+        )
+
         # 스트림 시작
         try:
             self._stream = sd.InputStream(
                 device=device_idx,
-                samplerate=self.config.recording.sample_rate,
-                channels=self.config.recording.channels,
-                dtype="float32",
+                samplerate=self._sr,
+                channels=self._ch,
+                dtype=STREAM_DTYPE,
                 blocksize=1024,
                 callback=self._audio_callback,
             )
@@ -428,6 +790,8 @@ class ChunkedRecorder:
 
         # 청크 처리 스레드 시작
         self._stop_event.clear()
+        self._writer_thread = threading.Thread(target=self._writer_loop, daemon=True)
+        self._writer_thread.start()
         self._chunk_thread = threading.Thread(
             target=self._chunk_processing_loop,
             daemon=True,
@@ -438,6 +802,11 @@ class ChunkedRecorder:
         self._monitor_thread = threading.Thread(target=self._monitor_silence_loop, daemon=True)
         self._monitor_thread.start()
 
+        # 장치 스캔 스레드 시작
+        self._scan_trigger.clear()
+        self._scan_thread = threading.Thread(target=self._scan_worker_loop, daemon=True)
+        self._scan_thread.start()
+
         self.state.is_recording = True
         logger.info("청크 녹음 시작됨")
         return True
@@ -449,24 +818,36 @@ class ChunkedRecorder:
 
         # 스레드 중지
         self._stop_event.set()
+        self._data_ready.set()
         if self._chunk_thread:
             self._chunk_thread.join(timeout=5.0)
         if self._monitor_thread:
             self._monitor_thread.join(timeout=2.0)
+        if self._scan_thread:
+            self._scan_trigger.set()
+            self._scan_thread.join(timeout=2.0)
+        if self._probe_pool is not None:
+            self._probe_pool.close_all()
+            self._probe_pool = None
 
         # 남은 버퍼 저장
-        with self._buffer_lock:
-            if self._audio_buffer:
-                remaining = np.concatenate(self._audio_buffer, axis=0)
-                if len(remaining) > self.config.recording.sample_rate:  # 최소 1초
-                    chunk = self._save_chunk(remaining)
-                    if chunk:
-                        self._handle_session(chunk)
-                self._audio_buffer = []
+        pending = self._ring_w - self._ring_r
+        if pending > self._sr:  # 최소 1초
+            chunk = self._save_chunk(self._peek_ring(pending))
+            if chunk:
+                self._handle_session(chunk)
+        self._consume_ring(pending)
+        if self._ring_overruns:
+            logger.warning(f"버퍼 초과로 버려진 오디오 블록: {self._ring_overruns}개")
 
         # 현재 세션 완료
         self._complete_current_session()
 
+        # 대기 중인 파일 쓰기 마무리
+        if self._writer_thread:
+            self._write_queue.put(None)
+            self._writer_thread.join(timeout=10.0)
+
         # 스트림 중지
         if self._stream:
             self._stream.stop()
@@ -492,22 +873,29 @@ class ChunkedRecorder:
         """장치 변경 시 호출될 콜백을 등록합니다."""
         self._on_device_changed.append(callback)
 
-    def _check_alternative_devices(self) -> None:
-        """다른 활성 장치가 있는지 스캔하고 전환합니다."""
-        # 너무 잦은 스캔 방지 (최소 5초 간격)
-        now = time.time()
-        if now - self._last_device_scan_time < 5.0:
-            return
+    def _check_alternative_devices(self) -> bool:
+        """다른 활성 장치 스캔을 요청합니다.
+
+        스캔은 상주 스캔 스레드에서 실행되어 녹음 루프를 막지 않습니다.
+        요청했으면 True, 최소 간격이 지나지 않아 건너뛰었으면 False를 반환합니다.
+        """
+        # 너무 잦은 스캔 방지 (최소 5초, 대안 장치가 없으면 점점 늘어남)
+        now = time.monotonic_ns()
+        if now - self._last_device_scan_time < self._scan_interval_ns:
+            return False
         
         self._last_device_scan_time = now
-        
-        # 별도 스레드에서 실행하여 녹음 루프 차단 방지
-        threading.Thread(target=self._scan_and_switch, daemon=True).start()
+        self._scan_trigger.set()
+        return True
 
     def _scan_and_switch(self) -> None:
         """백그라운드에서 장치를 스캔하고 필요시 전환합니다."""
         try:
-            from .auto_detect import find_active_audio_device
+            from .auto_detect import AudioProbePool, find_active_audio_device
+            
+            # 무음이 이어지는 동안 같은 장치를 반복 스캔하므로 프로브 스트림을 재사용
+            if self._probe_pool is None:
+                self._probe_pool = AudioProbePool()
             
             # 현재 장치
             current_idx = self.device
@@ -522,17 +910,27 @@ class ChunkedRecorder:
                 threshold=0.005,  # 약간 높은 임계값
                 exclude_keywords=["microphone", "mic", "마이크", "webcam"],  # 마이크 제외
                 exclude_indices=[current_idx],  # [중요] 현재 사용 중인 장치 제외 (간섭 방지)
-                verbose=False
+                verbose=False,
+                probe_pool=self._probe_pool,
             )
             
             if active_device and active_device.index != current_idx:
                 logger.info(f"더 나은 신호 발견: [{active_device.index}] {active_device.name} (RMS: {active_device.rms_level:.4f})")
+                # 전환할 장치를 풀이 열어 두고 있으면 충돌하므로 먼저 모두 닫음
+                self._probe_pool.close_all()
                 self.switch_device(active_device.index)
-            else:
-                logger.debug("대안 장치 없음")
+                self._scan_interval_ns = self.DEVICE_SCAN_INTERVAL_NS
+                return
+            logger.debug("대안 장치 없음")
                 
         except Exception as e:
             logger.warning(f"장치 스캔 실패: {e}")
+        
+        # 무음이 계속되는 동안 모든 장치를 반복해서 여는 것을 피하기 위해 간격을 늘림
+        self._scan_interval_ns = min(
+            self._scan_interval_ns * 2, self.DEVICE_SCAN_MAX_INTERVAL_NS
+        )
+        logger.debug(f"다음 장치 스캔까지 최소 {self._scan_interval_ns / 1e9:.0f}초")
 
     def switch_device(self, new_device_index: int) -> bool:
         """녹음 장치를 전환합니다."""
@@ -554,9 +952,9 @@ class ChunkedRecorder:
             self.device = new_device_index
             self._stream = sd.InputStream(
                 device=new_device_index,
-                samplerate=self.config.recording.sample_rate,
-                channels=self.config.recording.channels,
-                dtype="float32",
+                samplerate=self._sr,
+                channels=self._ch,
+                dtype=STREAM_DTYPE,
                 blocksize=1024,
                 callback=self._audio_callback,
             )
@@ -570,6 +968,7 @@ class ChunkedRecorder:
             
             # 상태 초기화
             self.state.consecutive_silence_count = 0
+            self._flush_session()
             
             # 콜백 호출
             for callback in self._on_device_changed:
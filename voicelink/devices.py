@@ -1,5 +1,6 @@
 """Audio device enumeration and selection."""
 
+import time
 from dataclasses import dataclass
 from typing import Optional
 
@@ -8,7 +9,7 @@ import sounddevice as sd
 from .platform_utils import Platform, get_platform
 
 
-@dataclass
+@dataclass(slots=True)
 class AudioDevice:
     """Represents an audio device."""
 
@@ -21,6 +22,8 @@ class AudioDevice:
     is_output: bool
     is_loopback: bool = False
     is_virtual: bool = False
+    # Last measured signal level, filled in by auto-detection.
+    rms_level: float = 0.0
 
     @property
     def can_capture(self) -> bool:
@@ -72,13 +75,64 @@ def _is_loopback_device(name: str, platform: Platform) -> bool:
     return False
 
 
+# Enumerating PortAudio devices is slow, and auto-detection asks for the
+# device list many times in a row, so results are reused for a short while.
+DEVICE_CACHE_TTL = 2.0
+_raw_devices_cache: Optional[tuple[float, tuple]] = None
+_devices_cache: Optional[tuple[float, list[AudioDevice]]] = None
+# (the _devices_cache entry it was computed from, best loopback device)
+_loopback_cache: Optional[tuple[tuple, Optional[AudioDevice]]] = None
+
+
+def invalidate_device_cache() -> None:
+    """Forget cached device lists, e.g. after installing a driver."""
+    global _raw_devices_cache, _devices_cache
+    _raw_devices_cache = None
+    _devices_cache = None
+    invalidate_loopback_cache()
+
+
+def invalidate_loopback_cache() -> None:
+    """Forget the cached `find_best_loopback_device` result."""
+    global _loopback_cache
+    _loopback_cache = None
+
+
+def _query_devices_raw() -> tuple:
+    """Return `sd.query_devices()` as a tuple, cached for DEVICE_CACHE_TTL seconds."""
+    global _raw_devices_cache
+    now = time.monotonic()
+    cached = _raw_devices_cache
+    if cached is not None and now - cached[0] < DEVICE_CACHE_TTL:
+        return cached[1]
+
+    raw = tuple(sd.query_devices())
+    _raw_devices_cache = (now, raw)
+    return raw
+
+
+def query_device_info(index: int) -> dict:
+    """Return the sounddevice info dict for a device index (cached)."""
+    return _query_devices_raw()[index]
+
+
 def list_devices() -> list[AudioDevice]:
-    """List all available audio devices."""
+    """List all available audio devices.
+
+    The result is cached for DEVICE_CACHE_TTL seconds; see
+    `invalidate_device_cache`.
+    """
+    global _devices_cache
+    now = time.monotonic()
+    cached = _devices_cache
+    if cached is not None and now - cached[0] < DEVICE_CACHE_TTL:
+        return list(cached[1])
+
     current_platform = get_platform()
     devices = []
 
     try:
-        raw_devices = sd.query_devices()
+        raw_devices = _query_devices_raw()
 
         for idx, device in enumerate(raw_devices):
             if isinstance(device, dict):
@@ -102,8 +156,10 @@ def list_devices() -> list[AudioDevice]:
 
     except Exception as e:
         print(f"Error querying devices: {e}")
+        return devices
 
-    return devices
+    _devices_cache = (now, devices)
+    return list(devices)
 
 
 def list_capture_devices() -> list[AudioDevice]:
@@ -141,9 +197,26 @@ def get_device_by_name(name: str, partial_match: bool = True) -> Optional[AudioD
 
 
 def find_best_loopback_device() -> Optional[AudioDevice]:
-    """Find the best loopback device for system audio capture."""
-    current_platform = get_platform()
+    """Find the best loopback device for system audio capture.
+
+    The choice is reused for as long as the device enumeration it was made
+    from is still cached.
+    """
+    global _loopback_cache
     devices = list_devices()
+    snapshot = _devices_cache
+    cached = _loopback_cache
+    if snapshot is not None and cached is not None and cached[0] is snapshot:
+        return cached[1]
+
+    best = _select_best_loopback(devices)
+    if snapshot is not None:
+        _loopback_cache = (snapshot, best)
+    return best
+
+
+def _select_best_loopback(devices: list[AudioDevice]) -> Optional[AudioDevice]:
+    current_platform = get_platform()
 
     # Priority order for each platform
     if current_platform == Platform.MACOS:
@@ -1,9 +1,11 @@
 """Platform-specific utilities for audio driver detection and installation."""
 
+import functools
 import platform
 import shutil
 import subprocess
 import sys
+import time
 from dataclasses import dataclass
 from enum import Enum
 from typing import Optional
@@ -26,6 +28,7 @@ class DriverStatus:
     install_instructions: Optional[str] = None
 
 
+@functools.cache
 def get_platform() -> Platform:
     """Detect the current operating system."""
     system = platform.system().lower()
@@ -93,8 +96,34 @@ def check_pulseaudio_monitor() -> bool:
         return False
 
 
+# Driver installation can change while the process runs (e.g. after
+# `brew install`), so its status is cached only briefly.
+DRIVER_STATUS_TTL = 5.0
+_driver_status_cache: Optional[tuple[float, DriverStatus]] = None
+
+
+def invalidate_driver_status() -> None:
+    """Drop the cached driver status so the next call re-checks the system."""
+    global _driver_status_cache
+    _driver_status_cache = None
+
+
 def get_driver_status() -> DriverStatus:
-    """Get the status of virtual audio driver for current platform."""
+    """Get the status of virtual audio driver for current platform.
+
+    The result is cached for DRIVER_STATUS_TTL seconds.
+    """
+    global _driver_status_cache
+    now = time.monotonic()
+    if _driver_status_cache is not None and now - _driver_status_cache[0] < DRIVER_STATUS_TTL:
+        return _driver_status_cache[1]
+
+    status = _check_driver_status()
+    _driver_status_cache = (now, status)
+    return status
+
+
+def _check_driver_status() -> DriverStatus:
     current_platform = get_platform()
 
     if current_platform == Platform.MACOS:
@@ -196,13 +225,21 @@ def setup_driver(auto_install: bool = False) -> DriverStatus:
         response = input("\nWould you like to install BlackHole now? [y/N]: ")
         if response.lower() in ("y", "yes"):
             if install_blackhole():
+                from .devices import invalidate_device_cache
+
+                invalidate_driver_status()
+                invalidate_device_cache()
                 return get_driver_status()
 
     return status
 
 
+@functools.cache
 def get_system_info() -> dict:
-    """Get system information for debugging."""
+    """Get system information for debugging.
+
+    The result is computed once per process; treat it as read-only.
+    """
     return {
         "platform": get_platform().value,
         "system": platform.system(),
@@ -9,9 +9,43 @@ from typing import Optional, Union
 import numpy as np
 from scipy.io import wavfile
 
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
 from .capture import AudioCapture, CaptureConfig
 
 
+def _float_to_int16_numpy(src: np.ndarray) -> np.ndarray:
+    """Clip float32 samples to [-1, 1] and convert to int16 (NumPy version)."""
+    scaled = np.multiply(src, 32767.0, dtype=np.float32)
+    np.clip(scaled, -32767.0, 32767.0, out=scaled)
+    return scaled.astype(np.int16)
+
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _f32_to_i16(src, dst):
+        """Clip and convert in one pass over the samples (Numba version)."""
+        for i in prange(src.size):
+            v = src[i]
+            if v > 1.0:
+                v = 1.0
+            elif v < -1.0:
+                v = -1.0
+            dst[i] = np.int16(v * 32767.0)
+
+    def _float_to_int16(src: np.ndarray) -> np.ndarray:
+        """Clip float32 samples to [-1, 1] and convert to int16."""
+        src = np.ascontiguousarray(src)
+        dst = np.empty(src.shape, dtype=np.int16)
+        _f32_to_i16(src.ravel(), dst.ravel())
+        return dst
+else:
+    _float_to_int16 = _float_to_int16_numpy
+
+
 @dataclass
 class RecordingConfig:
     """Configuration for audio recording."""
@@ -68,13 +102,13 @@ class AudioRecorder:
 
     def _recording_loop(self) -> None:
         """Main recording loop."""
-        start_time = time.time()
+        start_time = time.monotonic()
 
         try:
             while not self._stop_event.is_set():
                 # Check duration limit
                 if self.config.duration is not None:
-                    elapsed = time.time() - start_time
+                    elapsed = time.monotonic() - start_time
                     if elapsed >= self.config.duration:
                         break
 
@@ -126,7 +160,7 @@ class AudioRecorder:
 
         # Convert float32 to int16 for WAV
         if audio_data.dtype == np.float32:
-            audio_data = (audio_data * 32767).astype(np.int16)
+            audio_data = _float_to_int16(audio_data)
 
         wavfile.write(str(output_path), self.config.sample_rate, audio_data)
         print(f"Saved WAV: {output_path}")
@@ -146,7 +180,7 @@ class AudioRecorder:
 
         # Convert to int16
         if audio_data.dtype == np.float32:
-            audio_data = (audio_data * 32767).astype(np.int16)
+            audio_data = _float_to_int16(audio_data)
 
         # Create AudioSegment from raw data
         audio_segment = AudioSegment(
@@ -175,6 +209,7 @@ class AudioRecorder:
             device=self.config.device,
             sample_rate=self.config.sample_rate,
             channels=self.config.channels,
+            enable_queue=False,  # consumed via callback only
         )
         self._capture = AudioCapture(capture_config)
         self._capture.add_callback(self._collect_callback)
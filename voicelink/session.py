@@ -164,11 +164,24 @@ class SessionManager:
         self.db_path = self.data_dir / "sessions.db"
         self._init_db()
 
+    def _connect(self) -> sqlite3.Connection:
+        """DB 연결을 엽니다.
+
+        WAL 모드에서는 트랜잭션마다 fsync 할 필요가 없으므로
+        synchronous=NORMAL로 낮춥니다 (연결 단위 설정).
+        """
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
     def _init_db(self) -> None:
         """데이터베이스를 초기화합니다."""
         self.data_dir.mkdir(parents=True, exist_ok=True)
 
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
+            # WAL 모드: 녹음 중 쓰기와 check_db.py 같은 읽기가 서로 막지 않음
+            # (DB 파일에 영구 저장되는 설정)
+            conn.execute("PRAGMA journal_mode=WAL")
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS sessions (
                     session_id TEXT PRIMARY KEY,
@@ -205,7 +218,7 @@ class SessionManager:
 
     def save_session(self, session: Session) -> None:
         """세션을 저장합니다."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             conn.execute("""
                 INSERT OR REPLACE INTO sessions
                 (session_id, start_time, end_time, status, tags,
@@ -230,7 +243,7 @@ class SessionManager:
 
     def get_session(self, session_id: str) -> Optional[Session]:
         """세션 ID로 세션을 가져옵니다."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.execute(
                 "SELECT data FROM sessions WHERE session_id = ?",
                 (session_id,)
@@ -241,21 +254,24 @@ class SessionManager:
             return Session.from_dict(json.loads(row[0]))
         return None
 
-    def list_sessions(
-        self,
+    @staticmethod
+    def _select_sessions(
+        conn: sqlite3.Connection,
         date: Optional[datetime] = None,
         status: Optional[str] = None,
         tag: Optional[str] = None,
         limit: int = 100,
     ) -> list[Session]:
-        """세션 목록을 가져옵니다."""
+        """주어진 연결에서 세션 목록을 조회합니다."""
         query = "SELECT data FROM sessions WHERE 1=1"
         params = []
 
         if date:
-            date_str = date.strftime("%Y-%m-%d")
-            query += " AND start_time LIKE ?"
-            params.append(f"{date_str}%")
+            # LIKE 대신 범위 조건을 사용해야 idx_sessions_start_time 인덱스를 탐
+            day_start = date.strftime("%Y-%m-%d")
+            day_end = (date + timedelta(days=1)).strftime("%Y-%m-%d")
+            query += " AND start_time >= ? AND start_time < ?"
+            params.extend([day_start, day_end])
 
         if status:
             query += " AND status = ?"
@@ -268,12 +284,20 @@ class SessionManager:
         query += " ORDER BY start_time DESC LIMIT ?"
         params.append(limit)
 
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute(query, params)
-            rows = cursor.fetchall()
-
+        rows = conn.execute(query, params).fetchall()
         return [Session.from_dict(json.loads(row[0])) for row in rows]
 
+    def list_sessions(
+        self,
+        date: Optional[datetime] = None,
+        status: Optional[str] = None,
+        tag: Optional[str] = None,
+        limit: int = 100,
+    ) -> list[Session]:
+        """세션 목록을 가져옵니다."""
+        with self._connect() as conn:
+            return self._select_sessions(conn, date=date, status=status, tag=tag, limit=limit)
+
     def list_sessions_by_date(self, date: datetime) -> list[Session]:
         """특정 날짜의 세션 목록을 가져옵니다."""
         return self.list_sessions(date=date)
@@ -282,6 +306,22 @@ class SessionManager:
         """오늘 세션 목록을 가져옵니다."""
         return self.list_sessions(date=datetime.now())
 
+    def get_today_summary(self) -> tuple[list[Session], dict]:
+        """오늘 세션 목록과 저장소 통계를 함께 가져옵니다.
+
+        get_today_sessions()와 get_stats()를 따로 호출하는 대신
+        하나의 연결/읽기 트랜잭션에서 두 조회를 모두 처리합니다.
+
+        Returns:
+            (오늘 세션 목록, get_stats()와 같은 형식의 통계) 튜플
+        """
+        with self._connect() as conn:
+            conn.execute("BEGIN")
+            sessions = self._select_sessions(conn, date=datetime.now())
+            stats = self._count_sessions(conn)
+        stats.update(self._disk_usage())
+        return sessions, stats
+
     def delete_session(self, session_id: str, delete_files: bool = False) -> bool:
         """세션을 삭제합니다."""
         session = self.get_session(session_id)
@@ -295,7 +335,7 @@ class SessionManager:
                 if chunk_path.exists():
                     chunk_path.unlink()
 
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             conn.execute("DELETE FROM sessions WHERE session_id = ?", (session_id,))
             conn.commit()
 
@@ -307,7 +347,7 @@ class SessionManager:
         cutoff = datetime.now() - timedelta(days=days)
         cutoff_str = cutoff.isoformat()
 
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.execute(
                 "SELECT data FROM sessions WHERE start_time < ?",
                 (cutoff_str,)
@@ -394,31 +434,38 @@ class SessionManager:
         logger.info(f"세션 내보내기 완료: {output_path}")
         return output_path
 
-    def get_stats(self) -> dict:
-        """저장소 통계를 반환합니다."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute("SELECT COUNT(*) FROM sessions")
-            total_sessions = cursor.fetchone()[0]
-
-            cursor = conn.execute(
-                "SELECT COUNT(*) FROM sessions WHERE status = 'recording'"
-            )
-            recording_sessions = cursor.fetchone()[0]
-
-            cursor = conn.execute(
-                "SELECT COUNT(*) FROM sessions WHERE transcription_status = 'completed'"
-            )
-            transcribed_sessions = cursor.fetchone()[0]
+    @staticmethod
+    def _count_sessions(conn: sqlite3.Connection) -> dict:
+        """세션 수 통계를 한 번의 쿼리로 계산합니다."""
+        row = conn.execute("""
+            SELECT
+                COUNT(*),
+                COALESCE(SUM(status = 'recording'), 0),
+                COALESCE(SUM(transcription_status = 'completed'), 0)
+            FROM sessions
+        """).fetchone()
+        return {
+            "total_sessions": row[0],
+            "recording_sessions": row[1],
+            "transcribed_sessions": row[2],
+        }
 
-        # 디스크 사용량 계산
+    def _disk_usage(self) -> dict:
+        """WAV 파일 디스크 사용량을 계산합니다."""
         total_size = 0
         for path in self.data_dir.rglob("*.wav"):
             total_size += path.stat().st_size
 
         return {
-            "total_sessions": total_sessions,
-            "recording_sessions": recording_sessions,
-            "transcribed_sessions": transcribed_sessions,
             "disk_usage_bytes": total_size,
             "disk_usage_mb": total_size / (1024 * 1024),
         }
+
+    def get_stats(self) -> dict:
+        """저장소 통계를 반환합니다."""
+        with self._connect() as conn:
+            stats = self._count_sessions(conn)
+
+        # 디스크 사용량 계산
+        stats.update(self._disk_usage())
+        return stats
@@ -232,6 +232,7 @@ class OpenAIRealtimeStream:
             device=self.config.device,
             sample_rate=self.config.sample_rate,
             channels=self.config.channels,
+            enable_queue=False,  # consumed via callback only
         )
         self._capture = AudioCapture(capture_config)
         self._capture.add_callback(self._on_audio_data)
@@ -3,8 +3,10 @@
 Ollama 로컬 LLM을 사용하여 세션 제목을 자동 생성합니다.
 """
 
+import asyncio
 import logging
 import re
+import time
 from dataclasses import dataclass
 from typing import Optional
 
@@ -12,6 +14,12 @@ import httpx
 
 logger = logging.getLogger(__name__)
 
+# Ollama가 모델 로드 중이거나 과부하일 때 돌려주는 일시적 오류 응답
+RETRY_STATUS_CODES = frozenset({502, 503, 504})
+
+# generate_many()가 공유하는 비동기 클라이언트의 최대 연결 수
+ASYNC_MAX_CONNECTIONS = 8
+
 
 @dataclass
 class TitleGeneratorConfig:
@@ -20,6 +28,9 @@ class TitleGeneratorConfig:
     model: str = "qwen2.5:3b"  # 빠르고 정확한 모델
     timeout: float = 30.0
     max_transcript_length: int = 1000  # 전사문 최대 길이
+    keep_alive: str = "30m"  # 요청 후 Ollama가 모델을 메모리에 유지하는 시간
+    max_retries: int = 3  # 502/503/504 응답 시 재시도 횟수
+    retry_backoff: float = 0.5  # 첫 재시도 대기 시간 (초, 재시도마다 2배)
 
 
 class TitleGenerator:
@@ -35,7 +46,69 @@ class TitleGenerator:
 
     def __init__(self, config: Optional[TitleGeneratorConfig] = None):
         self.config = config or TitleGeneratorConfig()
-        self._client = httpx.Client(timeout=self.config.timeout)
+        # 호출마다 새 연결을 맺지 않도록 keep-alive 연결 풀을 공유.
+        # transport 재시도는 연결 실패만 다루고, 502/503/504 응답은
+        # _post_generate()에서 따로 재시도합니다.
+        self._client = httpx.Client(
+            timeout=httpx.Timeout(self.config.timeout, connect=5.0),
+            limits=httpx.Limits(max_keepalive_connections=4, max_connections=4),
+            transport=httpx.HTTPTransport(retries=3),
+        )
+        # generate_many()용 비동기 클라이언트 (처음 사용할 때 생성)와 그 이벤트 루프
+        self._async_client: Optional[httpx.AsyncClient] = None
+        self._async_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_async_client(self) -> httpx.AsyncClient:
+        """현재 이벤트 루프에서 쓸 공유 비동기 클라이언트를 반환합니다.
+
+        비동기 연결은 만든 이벤트 루프에 묶이므로, asyncio.run()이 새 루프를
+        만들었으면 클라이언트도 새로 만듭니다.
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_loop is not loop:
+            self._async_client = httpx.AsyncClient(
+                timeout=httpx.Timeout(self.config.timeout, connect=5.0),
+                limits=httpx.Limits(
+                    max_keepalive_connections=ASYNC_MAX_CONNECTIONS,
+                    max_connections=ASYNC_MAX_CONNECTIONS,
+                    keepalive_expiry=30,
+                ),
+                transport=httpx.AsyncHTTPTransport(retries=3),
+            )
+            self._async_loop = loop
+        return self._async_client
+
+    async def aclose(self) -> None:
+        """비동기 HTTP 연결 풀을 닫습니다."""
+        client, self._async_client = self._async_client, None
+        self._async_loop = None
+        if client is not None:
+            await client.aclose()
+
+    def close(self) -> None:
+        """HTTP 연결 풀을 닫습니다 (비동기 클라이언트 포함)."""
+        self._client.close()
+        if self._async_client is None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        try:
+            if loop is None:
+                asyncio.run(self.aclose())
+            else:
+                loop.create_task(self.aclose())
+        except Exception as e:
+            logger.debug(f"비동기 클라이언트 닫기 실패: {e}")
+
+    def __enter__(self) -> "TitleGenerator":
+        """컨텍스트 매니저 진입."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """컨텍스트 매니저 종료."""
+        self.close()
 
     def is_available(self) -> bool:
         """Ollama 서버 연결 가능 여부를 확인합니다."""
@@ -56,43 +129,150 @@ class TitleGenerator:
             logger.error(f"모델 목록 조회 실패: {e}")
         return []
 
+    def _prepare_transcript(self, transcript: str) -> Optional[str]:
+        """전사문 길이를 제한합니다. 너무 짧으면 None을 반환합니다."""
+        if not transcript or len(transcript.strip()) < 10:
+            return None
+        if len(transcript) > self.config.max_transcript_length:
+            return transcript[:self.config.max_transcript_length] + "..."
+        return transcript
+
+    def _build_payload(self, transcript: str) -> dict:
+        """Ollama /api/generate 요청 본문을 만듭니다."""
+        return {
+            "model": self.config.model,
+            "prompt": self.PROMPT_TEMPLATE.format(transcript=transcript),
+            "stream": False,
+            "keep_alive": self.config.keep_alive,
+            "options": {
+                "temperature": 0.3,
+                "num_predict": 50,
+            }
+        }
+
+    def _retry_delay(self, response: httpx.Response, attempt: int) -> Optional[float]:
+        """재시도할 응답이면 대기 시간(초)을, 아니면 None을 반환합니다."""
+        if response.status_code not in RETRY_STATUS_CODES or attempt >= self.config.max_retries:
+            return None
+        delay = self.config.retry_backoff * 2 ** attempt
+        logger.debug(f"Ollama 응답 {response.status_code}, {delay:.1f}초 후 재시도")
+        return delay
+
+    def _post_generate(self, payload: dict) -> httpx.Response:
+        """/api/generate로 요청하고 일시적 오류 응답(502/503/504)이면 재시도합니다."""
+        url = f"{self.config.ollama_url}/api/generate"
+        attempt = 0
+        while True:
+            response = self._client.post(url, json=payload)
+            delay = self._retry_delay(response, attempt)
+            if delay is None:
+                return response
+            time.sleep(delay)
+            attempt += 1
+
+    async def _apost_generate(self, payload: dict) -> httpx.Response:
+        """_post_generate()의 비동기 버전 (공유 비동기 클라이언트 사용)."""
+        client = self._get_async_client()
+        url = f"{self.config.ollama_url}/api/generate"
+        attempt = 0
+        while True:
+            response = await client.post(url, json=payload)
+            delay = self._retry_delay(response, attempt)
+            if delay is None:
+                return response
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def warm_up(self) -> bool:
+        """연결과 모델을 미리 준비합니다.
+
+        1토큰짜리 요청으로 TCP 연결과 모델 로드를 첫 generate() 호출 전에
+        끝내 둡니다. 세션 완료 콜백에서 콜드 스타트 지연을 피하려면
+        백그라운드 스레드에서 호출하세요.
+        """
+        try:
+            response = self._post_generate({
+                "model": self.config.model,
+                "prompt": "hi",
+                "stream": False,
+                "keep_alive": self.config.keep_alive,
+                "options": {"num_predict": 1},
+            })
+            return response.status_code == 200
+        except Exception as e:
+            logger.warning(f"모델 예열 실패: {e}")
+            return False
+
+    @staticmethod
+    def _parse_response(response: httpx.Response) -> Optional[str]:
+        """응답에서 제목을 추출합니다. 실패 시 None을 반환합니다."""
+        if response.status_code != 200:
+            return None
+        result = response.json()
+        title = result.get("response", "").strip()
+        # 제목 정리 (따옴표, 줄바꿈 제거)
+        title = re.sub(r'^["\']|["\']$', '', title)
+        title = title.split('\n')[0].strip()
+        return title if title else "녹음"
+
     def generate(self, transcript: str) -> str:
         """전사문에서 제목을 생성합니다."""
-        if not transcript or len(transcript.strip()) < 10:
+        prepared = self._prepare_transcript(transcript)
+        if prepared is None:
             return "무음 녹음"
 
-        # 전사문 길이 제한
-        if len(transcript) > self.config.max_transcript_length:
-            transcript = transcript[:self.config.max_transcript_length] + "..."
+        try:
+            response = self._post_generate(self._build_payload(prepared))
+            title = self._parse_response(response)
+            if title is not None:
+                return title
+
+        except Exception as e:
+            logger.error(f"제목 생성 실패: {e}")
 
-        prompt = self.PROMPT_TEMPLATE.format(transcript=transcript)
+        return self._fallback_title(prepared)
 
-        try:
-            response = self._client.post(
-                f"{self.config.ollama_url}/api/generate",
-                json={
-                    "model": self.config.model,
-                    "prompt": prompt,
-                    "stream": False,
-                    "options": {
-                        "temperature": 0.3,
-                        "num_predict": 50,
-                    }
-                }
-            )
+    async def _generate_async(self, transcript: str, semaphore: asyncio.Semaphore) -> str:
+        """비동기 클라이언트로 제목 하나를 생성합니다."""
+        prepared = self._prepare_transcript(transcript)
+        if prepared is None:
+            return "무음 녹음"
 
-            if response.status_code == 200:
-                result = response.json()
-                title = result.get("response", "").strip()
-                # 제목 정리 (따옴표, 줄바꿈 제거)
-                title = re.sub(r'^["\']|["\']$', '', title)
-                title = title.split('\n')[0].strip()
-                return title if title else "녹음"
+        try:
+            async with semaphore:
+                response = await self._apost_generate(self._build_payload(prepared))
+            title = self._parse_response(response)
+            if title is not None:
+                return title
 
         except Exception as e:
             logger.error(f"제목 생성 실패: {e}")
 
-        return self._fallback_title(transcript)
+        return self._fallback_title(prepared)
+
+    async def generate_many(
+        self,
+        transcripts: list[str],
+        max_concurrency: int = 8,
+    ) -> list[str]:
+        """여러 전사문의 제목을 동시에 생성합니다.
+
+        요청을 순차로 보내지 않고 공유 keep-alive 연결 풀에서 동시에 보내므로
+        전체 소요 시간이 가장 느린 요청 하나에 가까워집니다. 연결 풀은 호출
+        사이에 재사용되며 close()/aclose()에서 닫힙니다.
+
+        Args:
+            transcripts: 전사문 목록
+            max_concurrency: 최대 동시 요청 수 (연결 수는 ASYNC_MAX_CONNECTIONS까지)
+
+        Returns:
+            입력 순서와 같은 순서의 제목 목록
+        """
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        titles = await asyncio.gather(
+            *(self._generate_async(t, semaphore) for t in transcripts)
+        )
+        return list(titles)
 
     def _fallback_title(self, transcript: str) -> str:
         """폴백: 간단한 규칙 기반 제목 생성."""
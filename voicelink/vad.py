@@ -19,7 +19,7 @@ logger = logging.getLogger(__name__)
 class AudioFrame:
     """오디오 프레임을 나타내는 클래스."""
     
-    data: bytes
+    data: Union[bytes, memoryview]
     timestamp: float
     duration: float
 
@@ -64,15 +64,33 @@ def is_silent(
     return rms < threshold, rms
 
 
+def _as_pcm_view(audio_data: Union[bytes, memoryview, np.ndarray]) -> memoryview:
+    """PCM 데이터를 복사 없이 바이트 단위 memoryview로 변환합니다.
+
+    배열은 int16만 받습니다. float 오디오를 그대로 캐스팅하면 거의 0이 되어
+    무음으로 판정되므로, 호출하는 쪽에서 먼저 int16으로 스케일해야 합니다.
+    """
+    if isinstance(audio_data, np.ndarray):
+        if audio_data.dtype != np.int16:
+            raise ValueError(
+                f"int16 PCM 배열만 지원합니다 (입력 dtype: {audio_data.dtype}). "
+                "float 오디오는 32767을 곱해 int16으로 변환하세요."
+            )
+        audio_data = np.ascontiguousarray(audio_data)
+    return memoryview(audio_data).cast("B")
+
+
 def generate_frames(
-    audio_data: bytes,
+    audio_data: Union[bytes, memoryview, np.ndarray],
     sample_rate: int,
     frame_duration_ms: int = 30,
 ) -> Generator[AudioFrame, None, None]:
     """오디오 데이터를 프레임 단위로 분할합니다.
     
+    프레임 데이터는 원본 버퍼를 가리키는 memoryview로, 복사하지 않습니다.
+    
     Args:
-        audio_data: PCM 오디오 데이터 (16비트)
+        audio_data: PCM 오디오 데이터 (16비트, bytes/memoryview/int16 배열)
         sample_rate: 샘플 레이트
         frame_duration_ms: 프레임 길이 (밀리초)
     
@@ -82,6 +100,7 @@ def generate_frames(
     # 16비트 = 2바이트
     bytes_per_sample = 2
     frame_size = int(sample_rate * (frame_duration_ms / 1000.0) * bytes_per_sample)
+    audio_data = _as_pcm_view(audio_data)
     
     offset = 0
     timestamp = 0.0
@@ -98,14 +117,15 @@ def generate_frames(
 
 
 def extract_voice_segments(
-    audio_data: bytes,
+    audio_data: Union[bytes, memoryview, np.ndarray],
     sample_rate: int = 16000,
     config: Optional[VADConfig] = None,
 ) -> Generator[bytes, None, None]:
     """VAD를 사용하여 음성 구간만 추출합니다.
     
     Args:
-        audio_data: PCM 오디오 데이터 (16비트 모노)
+        audio_data: PCM 오디오 데이터 (16비트 모노). int16 배열을 그대로 넘기면
+            tobytes() 복사 없이 처리합니다.
         sample_rate: 샘플 레이트 (8000, 16000, 32000, 48000 Hz)
         config: VAD 설정
     